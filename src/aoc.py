@@ -1,23 +1,34 @@
+from __future__ import annotations
+
 import contextlib
-from collections.abc import Callable
-from cProfile import Profile
+import json
 from enum import Enum
+from functools import partial
 from importlib import import_module
 from pathlib import Path
-from pstats import Stats
-from statistics import mean
-from time import time
-from typing import Any
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import typer
-from rich.console import Console
-from rich.progress import Progress
-from rich.table import Table
 
 from utils import read_input
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+
+    from rich.progress import Progress
+    from rich.table import Table
+
+    from utils import Timing
+    from utils.answercache import Answer
+    from utils.memory import MemoryReport
+    from utils.profiling import Stacks
+
 app = typer.Typer()
 
+T = TypeVar("T")
+
 
 class DayType(str, Enum):
     # [[[cog
@@ -66,27 +77,136 @@ class SortType(str, Enum):
     TIME = "time"
 
 
+class ProfileFormat(str, Enum):
+    TEXT = "text"
+    COLLAPSED = "collapsed"
+    SPEEDSCOPE = "speedscope"
+
+
 class PartType(str, Enum):
     PART_1 = "part_1"
     PART_2 = "part_2"
 
 
-def time_it(day: str, iterations: int = 1, progress: Callable[..., Any] = lambda: None) -> tuple[float, float]:
+class CacheMode(str, Enum):
+    COLD = "cold"
+    WARM = "warm"
+    BOTH = "both"
+
+
+def time_part(  # noqa: PLR0913
+    day: str,
+    part: int,
+    iterations: int = 10,
+    warmup: int = 1,
+    budget: float = 1.0,
+    precision: float = 0.02,
+    cold: bool = False,
+    limit: float | None = None,
+    progress: Callable[..., Any] = lambda advance=1: None,
+) -> Timing:
+    from utils import measure
+    from utils.caches import clear_caches, find_caches
+
+    module = import_module(day)
+    input_str = read_input(day)
+    caches = find_caches(module)
+
+    func = getattr(module, f"part_{part}")
+    rounds = 0
+
+    def on_round() -> None:
+        nonlocal rounds
+        rounds += 1
+        progress(advance=1)
+
+    timing = measure(
+        func if limit is None else partial(run_limited, func, limit),
+        input_str,
+        warmup=warmup,
+        min_rounds=min(5, iterations),
+        max_rounds=iterations,
+        budget=budget,
+        precision=precision,
+        setup=partial(clear_caches, caches) if cold else lambda: None,
+        on_round=on_round,
+    )
+    # Rounds cut short by convergence, the budget or an error still count towards the bar
+    progress(advance=iterations - rounds)
+
+    return timing
+
+
+def run_limited(func: Callable[..., T], seconds: float, *args: Any) -> T:
+    from utils import time_limit
+
+    with time_limit(seconds):
+        return func(*args)
+
+
+def memory_part(day: str, part: int, top: int = 10) -> MemoryReport:
+    from utils.caches import clear_caches, find_caches
+    from utils.memory import measure_memory
+
     module = import_module(day)
     input_str = read_input(day)
+    clear_caches(find_caches(module))
+
+    return measure_memory(getattr(module, f"part_{part}"), input_str, top=top)
 
-    times: dict[int, list[float]] = {}
 
-    for i in [1, 2]:
-        times[i] = []
-        for _ in range(iterations):
-            start = time()
-            with contextlib.suppress(Exception):
-                getattr(module, f"part_{i}")(input_str)
-            times[i].append(time() - start)
+def phase_part(day: str, part: int, rounds: int = 10) -> dict[str, float]:
+    """Mean time per round spent in each ``utils.phase``, starting from cold caches every round."""
+
+    from utils.caches import clear_caches, find_caches
+    from utils.phases import record_phases
+
+    module = import_module(day)
+    input_str = read_input(day)
+    caches = find_caches(module)
+    func = getattr(module, f"part_{part}")
+
+    total = 0
+    with record_phases() as recorded:
+        for _ in range(rounds):
+            clear_caches(caches)
+            start = perf_counter_ns()
+            try:
+                func(input_str)
+            except Exception:
+                return {}
+            total += perf_counter_ns() - start
+
+    breakdown = {name: ns / rounds for name, ns in recorded.items()}
+    breakdown["unlabelled"] = max(total - sum(recorded.values()), 0) / rounds
+
+    return breakdown
+
+
+def run_parallel(
+    func: Callable[..., T],
+    day_names: list[str],
+    jobs: int,
+    *args: Any,
+    progress: Callable[[], Any] = lambda: None,
+) -> dict[str, tuple[T, T]]:
+    """Run ``func(day, part, *args)`` for both parts of every day in a process pool.
+
+    Each task gets a fresh worker process, so module level state such as ``functools.cache``
+    can not leak between days or parts. Results are returned keyed by day, ready to be
+    rendered in day order, while ``progress`` is called as each task completes.
+    """
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    results: dict[tuple[str, int], T] = {}
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as executor:
+        futures = {executor.submit(func, day, part, *args): (day, part) for day in day_names for part in (1, 2)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
             progress()
 
-    return mean(times[1]), mean(times[2])
+    return {day: (results[(day, 1)], results[(day, 2)]) for day in day_names}
 
 
 def list_to_days(days: list[DayType]) -> list[str]:
@@ -95,73 +215,759 @@ def list_to_days(days: list[DayType]) -> list[str]:
     return [d.value for d in days]
 
 
+def run_days(
+    description: str, func: Callable[..., T], day_names: list[str], jobs: int, progress: Progress, *args: Any
+) -> dict[str, tuple[T, T]]:
+    task = progress.add_task(description, total=len(day_names) * 2)
+    if jobs > 1:
+        return run_parallel(func, day_names, jobs, *args, progress=lambda: progress.update(task, advance=1))
+
+    results = {}
+    for day in day_names:
+        results[day] = (func(day, 1, *args), func(day, 2, *args))
+        progress.update(task, advance=2)
+
+    return results
+
+
+def phases_table(breakdowns: dict[str, tuple[dict[str, float], dict[str, float]]], rounds: int) -> Table:
+    from rich.table import Table
+
+    from utils.timing import format_ns
+
+    table = Table(title=f"AOC 2023 - Phases\n(cold, mean of {rounds:,} rounds)")
+
+    table.add_column("Day", justify="center", style="bold")
+    table.add_column("Part", justify="center")
+    table.add_column("Phase")
+    table.add_column("Time", justify="right")
+    table.add_column("Share", justify="right")
+
+    for day, parts in breakdowns.items():
+        for part, breakdown in enumerate(parts, 1):
+            if not breakdown:
+                table.add_row(f"{int(day.split("_")[1])}", f"{part}", "[red]ERROR[/red]", "", "")
+                continue
+            total = sum(breakdown.values()) or 1
+            for name, ns in sorted(breakdown.items(), key=lambda item: -item[1]):
+                table.add_row(f"{int(day.split("_")[1])}", f"{part}", name, format_ns(ns), f"{ns / total:.1%}")
+        table.add_section()
+
+    return table
+
+
+def benchmark_cells(
+    timings: list[tuple[Timing, Timing]], reports: tuple[MemoryReport, MemoryReport] | None
+) -> list[str]:
+    from utils.memory import format_bytes
+
+    cells: list[str] = []
+    for part in (0, 1):
+        cells.extend(f"{t[part]}" if t[part].ok else f"[red]{t[part]}[/red]" for t in timings)
+        if reports is not None:
+            report = reports[part]
+            cells.append(format_bytes(report.peak) if report.ok else "[red]ERROR[/red]")
+
+    return cells
+
+
 @app.command()
-def benchmark(iterations: int = 10, days: list[DayType] = []) -> None:
-    table = Table(title=f"AOC 2023 - Timings\n({iterations:,} iterations)")
+def benchmark(  # noqa: PLR0913
+    iterations: int = 10,
+    days: list[DayType] = [],
+    jobs: int = 1,
+    warmup: int = 1,
+    budget: float = 1.0,
+    precision: float = 0.02,
+    cache: CacheMode = CacheMode.WARM,
+    memory: bool = False,
+    phases: bool = False,
+    limit: float | None = None,
+    save: Path | None = None,
+) -> None:
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
+    from utils.baseline import Result, hash_input, save_results
+
+    table = Table(title=f"AOC 2023 - Timings\n(median ± stdev, up to {iterations:,} iterations)")
+
+    modes = [CacheMode.COLD, CacheMode.WARM] if cache == CacheMode.BOTH else [cache]
 
     table.add_column("Day", justify="center", style="bold")
-    table.add_column("Part 1", justify="right")
-    table.add_column("Part 2", justify="right")
+    for part in (1, 2):
+        for mode in modes:
+            table.add_column(f"Part {part}" + (f" ({mode.value})" if len(modes) > 1 else ""), justify="right")
+        if memory:
+            table.add_column(f"Part {part} peak", justify="right")
 
-    day_names = list_to_days(days)
+    day_names = sorted(list_to_days(days))
 
+    timings: dict[CacheMode, dict[str, tuple[Timing, Timing]]] = {}
     with Progress(transient=True) as progress:
-        task = progress.add_task("Running code", total=(len(day_names) * 2) * iterations)
-        for day in sorted(day_names):
-            p1, p2 = time_it(day, iterations, lambda: progress.update(task, advance=1))
+        task = progress.add_task("Running code", total=(len(day_names) * 2) * iterations * len(modes))
+        for mode in modes:
+            cold = mode == CacheMode.COLD
+            if jobs > 1:
+                timings[mode] = run_parallel(
+                    time_part,
+                    day_names,
+                    jobs,
+                    iterations,
+                    warmup,
+                    budget,
+                    precision,
+                    cold,
+                    limit,
+                    progress=lambda: progress.update(task, advance=iterations),
+                )
+            else:
+                advance = partial(progress.update, task, advance=1)
+                timings[mode] = {
+                    day: (
+                        time_part(day, 1, iterations, warmup, budget, precision, cold, limit, advance),
+                        time_part(day, 2, iterations, warmup, budget, precision, cold, limit, advance),
+                    )
+                    for day in day_names
+                }
+
+        reports = run_days("Measuring memory", memory_part, day_names, jobs, progress) if memory else {}
+        breakdowns = run_days("Timing phases", phase_part, day_names, jobs, progress, iterations) if phases else {}
+
+    for day in day_names:
+        _, d = day.split("_")
+        table.add_row(f"{int(d)}", *benchmark_cells([timings[mode][day] for mode in modes], reports.get(day)))
+
+    if save is not None:
+        save_results(
+            save,
+            [
+                Result(day, part, hash_input(read_input(day)), timing, mode.value)
+                for mode in modes
+                for day, parts in timings[mode].items()
+                for part, timing in enumerate(parts, 1)
+            ],
+        )
+
+    with Console() as console:
+        console.print(table)
+        if phases:
+            console.print(phases_table(breakdowns, iterations))
+
+
+@app.command()
+def caches(days: list[DayType] = []) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    from utils.caches import cache_memory, find_caches
+
+    table = Table(title="AOC 2023 - Caches\n(from cold)")
+
+    table.add_column("Day", justify="center", style="bold")
+    table.add_column("Part", justify="center")
+    table.add_column("Cache")
+    table.add_column("Hits", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Entries", justify="right")
+    table.add_column("Memory", justify="right")
+
+    for day in sorted(list_to_days(days)):
+        module = import_module(day)
+        input_str = read_input(day)
+        day_caches = find_caches(module)
+        for part in (1, 2):
+            stats, size = cache_memory(day_caches, getattr(module, f"part_{part}"), input_str)
+            for i, stat in enumerate(stats):
+                table.add_row(
+                    f"{int(day.split("_")[1])}",
+                    f"{part}",
+                    stat.name,
+                    "-" if stat.hits is None else f"{stat.hits:,}",
+                    "-" if stat.misses is None else f"{stat.misses:,}",
+                    f"{stat.entries:,}",
+                    f"{size / 1024:,.1f} KiB" if i == 0 else "",
+                )
+
+    with Console() as console:
+        console.print(table)
+
+
+@app.command()
+def compare(baseline: Path, current: Path, threshold: float = 0.05, alpha: float = 0.05) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    from utils.baseline import compare_results, load_results
+
+    base_meta, base_results = load_results(baseline)
+    curr_meta, curr_results = load_results(current)
+
+    table = Table(
+        title=f"AOC 2023 - Comparison\n{base_meta['revision']} (Python {base_meta['python']})"
+        f" → {curr_meta['revision']} (Python {curr_meta['python']})"
+    )
+
+    table.add_column("Day", justify="center", style="bold")
+    table.add_column("Part", justify="center")
+    table.add_column("Cache", justify="center")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("p-value", justify="right")
+
+    regressions = 0
+    for comparison in compare_results(base_results, curr_results):
+        change = f"{comparison.change:+.1%}"
+        if comparison.broken:
+            regressions += 1
+            change = "[red]MISSING[/red]" if comparison.missing else f"[red]{comparison.current}[/red]"
+        elif comparison.regressed(threshold, alpha):
+            regressions += 1
+            change = f"[red]{change}[/red]"
+        elif comparison.significant(alpha) and comparison.change < -threshold:
+            change = f"[green]{change}[/green]"
+        if comparison.input_changed:
+            change += " [yellow](input changed)[/yellow]"
+
+        table.add_row(
+            f"{int(comparison.day.split("_")[1])}",
+            f"{comparison.part}",
+            comparison.cache,
+            f"{comparison.baseline}",
+            "-" if comparison.missing else f"{comparison.current}",
+            change,
+            "-" if comparison.broken else f"{comparison.p_value:.3f}",
+        )
+
+    with Console() as console:
+        console.print(table)
+        if regressions:
+            console.print(
+                f"[red]{regressions} part(s) regressed by more than {threshold:.0%}, failed or went missing[/red]"
+            )
+
+    if regressions:
+        raise typer.Exit(code=1)
+
 
-            _, d = day.split("_")
-            table.add_row(f"{int(d)}", f"{p1:.4f}s", f"{p2:.4f}s")
+def print_function_totals(stacks: Stacks, title: str, limit: int = 30) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    from utils.profiling import frame_name, function_totals
+
+    table = Table(title=title)
+    table.add_column("Function")
+    table.add_column("Self", justify="right")
+    table.add_column("Total", justify="right")
+
+    grand_total = sum(stacks.values()) or 1
+    for frame, own, total in function_totals(stacks)[:limit]:
+        table.add_row(frame_name(frame), f"{own / grand_total:.1%}", f"{total / grand_total:.1%}")
+
+    with Console() as console:
+        console.print(table)
+
+
+def export_stacks(  # noqa: PLR0913
+    func: Callable[[str], Any],
+    input_str: str,
+    name: str,
+    format: ProfileFormat,
+    sample: bool,
+    hz: int,
+    output: Path | None,
+) -> None:
+    from utils.profiling import StackSampler, StackTracer, to_collapsed, to_speedscope
+
+    profiler = StackSampler(hz) if sample else StackTracer()
+    with profiler:
+        func(input_str)
+
+    match format:
+        case ProfileFormat.TEXT:
+            print_function_totals(profiler.stacks, f"{name} - {hz:,}Hz samples")
+            return
+        case ProfileFormat.COLLAPSED:
+            text = to_collapsed(profiler.stacks)
+        case ProfileFormat.SPEEDSCOPE:
+            text = json.dumps(to_speedscope(profiler.stacks, name))
+
+    if output is None:
+        print(text)
+    else:
+        output.write_text(text)
+
+
+def print_counters(title: str) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    from utils import instrument
+    from utils.timing import format_ns
+
+    table = Table(title=title)
+    table.add_column("Kind")
+    table.add_column("Name", style="bold")
+    table.add_column("Count", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Min", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("Max", justify="right")
+
+    for row in instrument.summary():
+        value = format_ns if row.kind == "timer" else lambda v: f"{v:,.0f}"
+        stats = [row.minimum, row.median, row.maximum]
+        table.add_row(
+            row.kind,
+            row.name,
+            f"{row.count:,}",
+            value(row.total),
+            *("" if stat is None else value(stat) for stat in stats),
+        )
 
     with Console() as console:
         console.print(table)
 
 
 @app.command()
-def profile(day: DayType, part: PartType, sort: SortType = SortType.CALLS) -> None:
+def profile(  # noqa: PLR0913
+    day: DayType,
+    part: PartType,
+    sort: SortType = SortType.CALLS,
+    format: ProfileFormat = ProfileFormat.TEXT,
+    sample: bool = False,
+    hz: int = 1000,
+    output: Path | None = None,
+    counters: bool = False,
+) -> None:
+    from cProfile import Profile
+    from pstats import Stats
+
+    from utils import instrument
+
     module = import_module(day)
     input_str = read_input(day)
+    func = getattr(module, part)
+
+    if counters:
+        instrument.reset()
+        instrument.enable()
+    try:
+        if format == ProfileFormat.TEXT and not sample:
+            with Profile() as profile:
+                func(input_str)
+                Stats(profile).strip_dirs().sort_stats(sort).print_stats()
+        else:
+            export_stacks(func, input_str, f"{day.value} {part.value}", format, sample, hz, output)
+    finally:
+        instrument.disable()
+
+    if counters:
+        print_counters(f"{day.value} {part.value} - counters")
+
+
+def short_location(location: str) -> str:
+    path, line = location.rsplit(":", 1)
+    return f"{Path(path).name}:{line}"
+
+
+@app.command()
+def memory(day: DayType, top: int = 10, diff: bool = False) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    from utils.memory import compare_snapshots, format_bytes
+
+    reports = {part: memory_part(day.value, part, top) for part in (1, 2)}
+
+    summary = Table(title=f"AOC 2023 - Memory\n{day.value}")
+    summary.add_column("Part", justify="center", style="bold")
+    summary.add_column("Peak", justify="right")
+    summary.add_column("Retained", justify="right")
+    summary.add_column("Blocks", justify="right")
+    summary.add_column("Snapshot", justify="center")
+    for part, report in reports.items():
+        if report.ok:
+            summary.add_row(
+                f"{part}",
+                format_bytes(report.peak),
+                format_bytes(report.retained),
+                f"{report.blocks:,}",
+                report.sampled,
+            )
+        else:
+            summary.add_row(f"{part}", f"[red]{report.error}[/red]", "", "", "")
+
+    tables = [summary]
+    for part, report in reports.items():
+        allocations = Table(title=f"Part {part} - top allocations {report.sampled}")
+        allocations.add_column("Line")
+        allocations.add_column("Size", justify="right")
+        allocations.add_column("Blocks", justify="right")
+        for location, size, count in report.top:
+            allocations.add_row(short_location(location), format_bytes(size), f"{count:,}")
+        tables.append(allocations)
+
+    if diff and (old := reports[1].snapshot) and (new := reports[2].snapshot):
+        changes = Table(title=f"Part 1 ({reports[1].sampled}) → Part 2 ({reports[2].sampled}) - allocations")
+        changes.add_column("Line")
+        changes.add_column("Size", justify="right")
+        changes.add_column("Blocks", justify="right")
+        for location, size, count in compare_snapshots(old, new, top):
+            changes.add_row(short_location(location), f"{'+' if size > 0 else ''}{format_bytes(size)}", f"{count:+,}")
+        tables.append(changes)
+
+    with Console() as console:
+        for table in tables:
+            console.print(table)
 
-    with Profile() as profile:
-        getattr(module, part)(input_str)
-        Stats(profile).strip_dirs().sort_stats(sort).print_stats()
 
+def scale_part(day: str, part: int, puzzle: str, rounds: int = 5, budget: float = 1.0) -> tuple[Timing, MemoryReport]:
+    from utils import measure
+    from utils.caches import clear_caches, find_caches
+    from utils.memory import measure_memory
+
+    module = import_module(day)
+    func = getattr(module, f"part_{part}")
+    caches = find_caches(module)
+
+    timing = measure(
+        func,
+        puzzle,
+        warmup=0,
+        min_rounds=min(3, rounds),
+        max_rounds=rounds,
+        budget=budget,
+        setup=partial(clear_caches, caches),
+    )
+    clear_caches(caches)
+
+    return timing, measure_memory(func, puzzle, top=0)
+
+
+def save_scale(path: Path, rows: list[dict[str, Any]]) -> None:
+    import csv
+
+    if path.suffix == ".csv":
+        with path.open("w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else [])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        path.write_text(json.dumps(rows, indent=2))
+
+
+def scale_table(rows: list[dict[str, Any]], sizes: list[int], title: str) -> Table:
+    from rich.table import Table
+
+    from utils.generators import fit_exponent
+    from utils.memory import format_bytes
+    from utils.timing import format_ns
+
+    table = Table(title=f"AOC 2023 - Scaling\n{title}")
+    table.add_column("Size", justify="right", style="bold")
+    for part in (1, 2):
+        table.add_column(f"Part {part}", justify="right")
+        table.add_column(f"Part {part} peak", justify="right")
+
+    for size in sizes:
+        cells = []
+        for row in rows:
+            if row["size"] != size:
+                continue
+            if row["error"]:
+                cells += [f"[red]{row['error']}[/red]", ""]
+            else:
+                cells += [format_ns(row["median_ns"]), format_bytes(row["peak_bytes"])]
+        table.add_row(f"{size:,}", *cells)
+
+    exponents = []
+    for part in (1, 2):
+        part_rows = [row for row in rows if row["part"] == part and not row["error"]]
+        part_sizes = [row["size"] for row in part_rows]
+        exponents += [
+            f"n^{fit_exponent(part_sizes, [row['median_ns'] for row in part_rows]):.2f}",
+            f"n^{fit_exponent(part_sizes, [row['peak_bytes'] for row in part_rows]):.2f}",
+        ]
+    table.add_section()
+    table.add_row("Fit", *exponents)
+
+    return table
+
+
+@app.command()
+def scale(  # noqa: PLR0913
+    day: DayType,
+    sizes: str = "1k,10k,100k",
+    seed: int = 0,
+    rounds: int = 5,
+    budget: float = 1.0,
+    output: Path | None = None,
+) -> None:
+    """Time each part on synthetic inputs of growing size and fit the empirical complexity."""
+
+    from rich.console import Console
+    from rich.progress import Progress
+
+    from utils.generators import GENERATORS, generate_input, parse_size
+
+    import_module(day.value)
+    if day.value not in GENERATORS:
+        Console().print(f"[red]{day.value} has no input generator[/red]")
+        raise typer.Exit(code=1)
+
+    size_list = [parse_size(size) for size in sizes.split(",")]
+
+    rows: list[dict[str, Any]] = []
+    with Progress(transient=True) as progress:
+        task = progress.add_task("Scaling", total=len(size_list) * 2)
+        for size in size_list:
+            puzzle = generate_input(day.value, size, seed)
+            for part in (1, 2):
+                timing, report = scale_part(day.value, part, puzzle, rounds, budget)
+                rows.append(
+                    {
+                        "day": day.value,
+                        "part": part,
+                        "size": size,
+                        "seed": seed,
+                        "median_ns": timing.median if timing.ok else None,
+                        "peak_bytes": report.peak if report.ok else None,
+                        "error": timing.error or report.error,
+                    }
+                )
+                progress.update(task, advance=1)
+
+    table = scale_table(rows, size_list, f"{day.value} (seed {seed})")
+
+    if output is not None:
+        save_scale(output, rows)
+
+    with Console() as console:
+        console.print(table)
+
+
+def batch_input(day: str, path: Path) -> dict[str, Any]:
+    """Answer both parts for one input file, from cold caches so memory doesn't build up."""
+
+    from utils.caches import clear_caches, find_caches
+    from utils.helpers import read_file
+
+    module = import_module(day)
+    caches = find_caches(module)
+
+    record: dict[str, Any] = {"input": str(path)}
+    try:
+        puzzle = read_file(path)
+    except Exception as e:
+        # Unreadable, corrupt or truncated, neither part gets to run so there's no latency either
+        error = f"read: {type(e).__name__}: {e}"
+        return record | {"part_1": None, "part_1_ns": None, "part_2": None, "part_2_ns": None, "error": error}
+
+    errors = []
+    for part in (1, 2):
+        clear_caches(caches)
+        start = perf_counter_ns()
+        try:
+            record[f"part_{part}"] = getattr(module, f"part_{part}")(puzzle)
+        except Exception as e:
+            record[f"part_{part}"] = None
+            errors.append(f"part {part}: {type(e).__name__}: {e}")
+        record[f"part_{part}_ns"] = perf_counter_ns() - start
+
+    record["error"] = "; ".join(errors) or None
+    return record
+
+
+def run_batch(day: str, paths: Iterable[Path], jobs: int) -> Iterator[dict[str, Any]]:
+    """Yield ``batch_input`` records as they complete.
+
+    Only ``2 * jobs`` inputs are in flight at once and the workers read the files themselves, so
+    memory stays flat however many inputs there are.
+    """
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+
+    if jobs <= 1:
+        yield from (batch_input(day, path) for path in paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: set[Future[dict[str, Any]]] = set()
+        for path in paths:
+            if len(pending) >= jobs * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            pending.add(executor.submit(batch_input, day, path))
+
+        yield from (future.result() for future in as_completed(pending))
+
+
+def batch_table(records: list[dict[str, Any]], elapsed: int, title: str) -> Table:
+    from rich.table import Table
+
+    from utils.timing import format_ns, percentile
+
+    table = Table(title=f"AOC 2023 - Batch\n{title}")
+    table.add_column("", style="bold")
+    for part in (1, 2):
+        table.add_column(f"Part {part}", justify="right")
+
+    failures = [sum(1 for record in records if record[f"part_{part}"] is None) for part in (1, 2)]
+    latencies = [[ns for record in records if (ns := record[f"part_{part}_ns"]) is not None] for part in (1, 2)]
+    table.add_row("Inputs", *[f"{len(records):,}"] * 2)
+    table.add_row("Failures", *[f"[red]{f:,}[/red]" if f else "0" for f in failures])
+    for pct in (50, 90, 99):
+        table.add_row(f"p{pct}", *[format_ns(percentile(ns, pct)) if ns else "-" for ns in latencies])
+    table.add_row("Max", *[format_ns(max(ns)) if ns else "-" for ns in latencies])
+    table.add_section()
+    table.add_row("Throughput", f"{len(records) / (elapsed / 1e9):,.1f} inputs/s", "")
+
+    return table
+
+
+@app.command()
+def batch(
+    day: DayType, inputs: Path, pattern: str = "*.txt*", jobs: int = 1, output: Path = Path("batch.jsonl")
+) -> None:
+    """Answer both parts for every input file in a directory, streaming answers to JSONL.
+
+    Inputs may be ``.gz``, ``.xz`` or ``.bz2`` compressed.
+    """
+
+    from rich.console import Console
+    from rich.progress import Progress
+
+    paths = sorted(inputs.glob(pattern))
+
+    records = []
+    start = perf_counter_ns()
+    with Progress(transient=True) as progress, output.open("w") as f:
+        task = progress.add_task("Running inputs", total=len(paths))
+        for record in run_batch(day.value, paths, jobs):
+            f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+            records.append(record)
+            progress.update(task, advance=1)
+    elapsed = perf_counter_ns() - start
+
+    with Console() as console:
+        console.print(batch_table(records, elapsed, f"{day.value} ({inputs})"))
+        for record in records:
+            if record["error"]:
+                console.print(f"[red]{record['input']}: {record['error']}[/red]")
+
+
+def answer_part(day: str, part: int) -> Answer:
+    from utils.answercache import Answer
 
-def run_day(day: str, progress: Callable[..., Any] = lambda: None) -> tuple[float, float]:
     module = import_module(day)
     input_str = read_input(day)
 
-    part_1 = 0
-    part_2 = 0
+    start = perf_counter_ns()
     with contextlib.suppress(Exception):
-        part_1 = module.part_1(input_str)  # type: ignore[unresolved-attribute]
-        progress()
-
-        part_2 = module.part_2(input_str)  # type: ignore[unresolved-attribute]
-        progress()
+        value = getattr(module, f"part_{part}")(input_str)
+        return Answer(value, perf_counter_ns() - start)
 
-    return part_1, part_2
+    return Answer(0)
 
 
 @app.command()
-def answers(days: list[DayType] = []) -> None:
+def answers(days: list[DayType] = [], jobs: int = 1, cache: bool = True) -> None:
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
+    from utils.answercache import CACHE_DIR, AnswerCache, answer_key
+    from utils.timing import format_ns
+
     table = Table(title="Advent of Code 2023 - Answers")
 
     table.add_column("Day", justify="center", style="bold")
     table.add_column("Part 1", justify="right")
     table.add_column("Part 2", justify="right")
 
-    day_names = list_to_days(days)
+    day_names = sorted(list_to_days(days))
 
-    with Progress(transient=True) as progress:
-        task = progress.add_task("Running code", total=(len(day_names) * 2))
-        for day in sorted(day_names):
-            p1, p2 = run_day(day, lambda: progress.update(task, advance=1))
+    store = AnswerCache(CACHE_DIR / "answers.json")
+    keys = {day: answer_key(day, read_input(day)) for day in day_names} if cache else {}
+
+    results: dict[str, tuple[Answer, Answer]] = {}
+    for day in keys:
+        hit_1, hit_2 = store.get(day, 1, keys[day]), store.get(day, 2, keys[day])
+        if hit_1 is not None and hit_2 is not None:
+            results[day] = (hit_1, hit_2)
 
-            table.add_row(f"{int(day.split("_")[1])}", f"{p1}", f"{p2}")
+    misses = [day for day in day_names if day not in results]
+    with Progress(transient=True) as progress:
+        task = progress.add_task("Running code", total=(len(misses) * 2))
+        if jobs > 1:
+            results |= run_parallel(answer_part, misses, jobs, progress=lambda: progress.update(task, advance=1))
+        else:
+            for day in misses:
+                results[day] = (answer_part(day, 1), answer_part(day, 2))
+                progress.update(task, advance=2)
+
+    for day in keys:
+        for part, answer in enumerate(results[day], 1):
+            store.put(day, part, keys[day], answer)
+    if cache:
+        store.save()
+
+    for day in day_names:
+        p1, p2 = results[day]
+        table.add_row(f"{int(day.split("_")[1])}", f"{p1.value}", f"{p2.value}")
 
     with Console() as console:
         console.print(table)
+        if cache:
+            console.print(f"Cache: {store.hits:,} hits, {store.misses:,} misses, saved {format_ns(store.saved)}")
+
+
+@app.command()
+def startup(module: str = "aoc", runs: int = 5, top: int = 15, target: float | None = None) -> None:
+    """Summarise the import cost of a module, failing if it takes longer than --target ms."""
+    from rich.console import Console
+    from rich.table import Table
+
+    from utils.importtime import by_package, measure_imports, total_time
+    from utils.timing import format_ns
+
+    imports = measure_imports(module, runs)
+    total = total_time(imports) or 1
+
+    modules = Table(title=f"AOC 2023 - Startup\nimport {module} (median of {runs:,} runs)")
+    modules.add_column("Module")
+    modules.add_column("Self", justify="right")
+    modules.add_column("Cumulative", justify="right")
+    modules.add_column("Share", justify="right")
+    for imported in sorted(imports, key=lambda imported: -imported.own)[:top]:
+        modules.add_row(
+            "  " * imported.depth + imported.module,
+            format_ns(imported.own * 1000),
+            format_ns(imported.cumulative * 1000),
+            f"{imported.own / total:.1%}",
+        )
+
+    packages = Table(title="By package")
+    packages.add_column("Package")
+    packages.add_column("Self", justify="right")
+    packages.add_column("Share", justify="right")
+    for package, own in by_package(imports)[:top]:
+        packages.add_row(package, format_ns(own * 1000), f"{own / total:.1%}")
+
+    with Console() as console:
+        console.print(modules)
+        console.print(packages)
+        console.print(f"Total: {format_ns(total * 1000)}")
+        if target is not None and total / 1000 > target:
+            console.print(f"[red]Over the {target:g}ms target[/red]")
+
+    if target is not None and total / 1000 > target:
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
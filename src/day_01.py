@@ -1,26 +1,133 @@
-from utils import no_input_skip, read_input
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from heapq import merge
+from itertools import batched, groupby
+from operator import sub
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
 
+from utils import input_generator, ints, no_input_skip, phase, read_input
 
+
+@phase("parse")
 def process_list(puzzle: str) -> tuple[list[int], list[int]]:
-    left, right = [], []
-    for line in puzzle.splitlines():
-        parts = line.split()
-        left.append(int(parts[0]))
-        right.append(int(parts[-1]))
+    values = ints(puzzle)
 
-    return sorted(left), sorted(right)
+    return sorted(values[::2]), sorted(values[1::2])
 
 
-def part_1(puzzle: str) -> int:
-    left, right = process_list(puzzle)
+@phase("parse")
+def columns(puzzle: str) -> tuple[array, array]:
+    values = ints(puzzle)
+
+    return values[::2], values[1::2]
+
+
+def distance(left: Iterable[int], right: Iterable[int]) -> int:
+    return sum(map(abs, map(sub, left, right)))
 
-    return sum(abs(l - r) for l, r in zip(left, right))
+
+def similarity(left: Iterable[int], right: Iterable[int]) -> int:
+    counts = Counter(right)
+    return sum(l * counts[l] for l in left)
+
+
+def part_1(puzzle: str) -> int:
+    return distance(*process_list(puzzle))
 
 
 def part_2(puzzle: str) -> int:
-    left, right = process_list(puzzle)
+    return similarity(*columns(puzzle))
+
+
+# -- Streaming, for inputs that don't fit in memory
+
+
+def _read_run(path: Path, block: int = 1 << 16) -> Iterator[int]:
+    with path.open("rb") as f:
+        while True:
+            values = array("q")
+            try:
+                values.fromfile(f, block)
+            except EOFError:
+                yield from values
+                return
+            yield from values
+
+
+def _write_run(path: Path, values: Iterable[int], block: int = 1 << 16) -> Path:
+    with path.open("wb") as f:
+        for chunk in batched(values, block):
+            array("q", chunk).tofile(f)
+    return path
+
+
+def _merge_runs(paths: list[Path], fan_in: int) -> Iterator[int]:
+    """Merge sorted runs, first combining them ``fan_in`` at a time so only that many files are ever open."""
+    while len(paths) > fan_in:
+        merged = []
+        for group in batched(paths, fan_in):
+            run = _write_run(group[0].with_suffix(".merged"), merge(*map(_read_run, group)))
+            for path in group[1:]:
+                path.unlink()
+            merged.append(run.replace(group[0]))
+        paths = merged
+
+    return merge(*map(_read_run, paths))
 
-    return sum(l * right.count(l) for l in left)
+
+@contextmanager
+def sorted_columns(
+    lines: Iterable[str], chunk_size: int = 1 << 20, fan_in: int = 64
+) -> Iterator[tuple[Iterator[int], Iterator[int]]]:
+    """Both columns in sorted order, external sorted through runs of ``chunk_size`` rows on disk.
+
+    Runs are merged at most ``fan_in`` at a time, the two columns together keep ``2 * fan_in``
+    files open, well under the usual descriptor limit however long the input.
+    """
+    with TemporaryDirectory() as directory:
+        runs: tuple[list[Path], list[Path]] = ([], [])
+        for index, chunk in enumerate(batched(lines, chunk_size)):
+            values = ints("\n".join(chunk))
+            for column, paths in enumerate(runs):
+                paths.append(_write_run(Path(directory, f"{column}-{index}"), sorted(values[column::2])))
+
+        left, right = (_merge_runs(paths, fan_in) for paths in runs)
+        yield left, right
+
+
+def merged_similarity(left: Iterator[int], right: Iterator[int]) -> int:
+    """``similarity`` of two sorted streams, walking them together instead of counting."""
+    total = 0
+    right_groups = groupby(right)
+    end = (None, iter(()))
+    value, group = next(right_groups, end)
+    for l, left_group in groupby(left):
+        while value is not None and value < l:
+            value, group = next(right_groups, end)
+        if value == l:
+            total += l * sum(1 for _ in left_group) * sum(1 for _ in group)
+            value, group = next(right_groups, end)
+
+    return total
+
+
+def part_1_streaming(lines: Iterable[str], chunk_size: int = 1 << 20, fan_in: int = 64) -> int:
+    with sorted_columns(lines, chunk_size, fan_in) as (left, right):
+        return distance(left, right)
+
+
+def part_2_streaming(lines: Iterable[str], chunk_size: int = 1 << 20, fan_in: int = 64) -> int:
+    with sorted_columns(lines, chunk_size, fan_in) as (left, right):
+        return merged_similarity(left, right)
+
+
+@input_generator
+def generate_input(size: int, rng: Random) -> str:
+    return "\n".join(f"{rng.randint(10_000, 99_999)}   {rng.randint(10_000, 99_999)}" for _ in range(size))
 
 
 # -- Tests
@@ -45,6 +152,28 @@ def test_part_2() -> None:
     assert part_2(test_input) == 31
 
 
+def test_generate_input() -> None:
+    test_input = generate_input(100, Random(0))
+    left, right = process_list(test_input)
+    assert len(left) == len(right) == 100
+    assert part_1(test_input) == sum(abs(l - r) for l, r in zip(left, right))
+
+
+def test_streaming() -> None:
+    test_input = generate_input(1_000, Random(0)) + "\n" + get_example_input()
+    lines = test_input.splitlines()
+    assert part_1_streaming(lines, chunk_size=64) == part_1(test_input)
+    assert part_2_streaming(lines, chunk_size=64) == part_2(test_input)
+    assert part_2_streaming(get_example_input().splitlines(), chunk_size=2) == 31
+
+
+def test_streaming_bounded_fan_in() -> None:
+    test_input = generate_input(1_000, Random(1))
+    lines = test_input.splitlines()
+    assert part_1_streaming(lines, chunk_size=7, fan_in=3) == part_1(test_input)
+    assert part_2_streaming(lines, chunk_size=7, fan_in=3) == part_2(test_input)
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
@@ -1,33 +1,101 @@
-from collections.abc import Iterable
-from itertools import pairwise
+from collections.abc import Sequence
+from itertools import combinations
+from operator import sub
+from random import Random
 
-from utils import no_input_skip, read_input
+from utils import input_generator, int_rows, no_input_skip, phase, read_input
 
+INCREASING = frozenset({1, 2, 3})
+DECREASING = frozenset({-1, -2, -3})
 
-def check_row(row: Iterable[int]) -> bool:
-    row_dir = 0
-    for a, b in pairwise(row):
-        direction = (a < b) - (a > b)
-        if abs(a - b) not in (1, 2, 3) or row_dir not in (0, direction):
-            return False
-        row_dir = direction
 
-    return True
+def check_row(row: Sequence[int]) -> bool:
+    steps = set(map(sub, row[1:], row))
+    return steps <= INCREASING or steps <= DECREASING
 
 
+def first_bad_level(row: Sequence[int], direction: int, skip: int = -1) -> int:
+    """Index of the first level that isn't a safe step on from the one before, or -1 if none.
+
+    ``direction`` is 1 for increasing and -1 for decreasing, the level at ``skip`` is ignored.
+    """
+    previous = None
+    for index, level in enumerate(row):
+        if index == skip:
+            continue
+        if previous is not None and not 1 <= (level - previous) * direction <= 3:
+            return index
+        previous = level
+
+    return -1
+
+
+def dampened(row: Sequence[int], direction: int) -> bool:
+    """Whether removing at most one level makes the row safe in ``direction``, in O(k).
+
+    Everything before the first bad step is fine, so only removing one of its two ends can help.
+    """
+    if (bad := first_bad_level(row, direction)) == -1:
+        return True
+
+    return first_bad_level(row, direction, bad) == -1 or first_bad_level(row, direction, bad - 1) == -1
+
+
+def fewest_removals(row: Sequence[int], direction: int, limit: int) -> int:
+    """Fewest levels to remove for the row to be safe in ``direction``, exact up to ``limit``.
+
+    ``kept[i]`` is the fewest removals for a safe row ending at level ``i``, which can only follow
+    one of the ``limit + 1`` levels before it. O(k * limit).
+    """
+    kept = list(range(len(row)))
+    for i, level in enumerate(row):
+        for j in range(max(0, i - limit - 1), i):
+            if 1 <= (level - row[j]) * direction <= 3:
+                kept[i] = min(kept[i], kept[j] + i - j - 1)
+
+    return min(removed + len(row) - 1 - i for i, removed in enumerate(kept))
+
+
+def is_safe(row: Sequence[int], tolerance: int = 0) -> bool:
+    """Whether the row is safe once at most ``tolerance`` bad levels are removed."""
+    if check_row(row):
+        return True
+    if tolerance == 1:
+        return dampened(row, 1) or dampened(row, -1)
+
+    return tolerance > 0 and any(fewest_removals(row, direction, tolerance) <= tolerance for direction in (1, -1))
+
+
+def count_safe(rows: Sequence[Sequence[int]], tolerance: int = 0) -> int:
+    return sum(1 for row in rows if is_safe(row, tolerance))
+
+
+@phase("parse")
 def puzzle_to_ints(puzzle: str) -> list[list[int]]:
-    return [list(map(int, row.split())) for row in puzzle.splitlines()]
+    return [row.tolist() for row in int_rows(puzzle)]
 
 
 def part_1(puzzle: str) -> int:
-    return sum(check_row(row) for row in puzzle_to_ints(puzzle))
+    return count_safe(puzzle_to_ints(puzzle))
 
 
 def part_2(puzzle: str) -> int:
-    return sum(
-        check_row(row) or any(check_row(row[:i] + row[i + 1 :]) for i in range(len(row)))
-        for row in puzzle_to_ints(puzzle)
-    )
+    return count_safe(puzzle_to_ints(puzzle), tolerance=1)
+
+
+@input_generator
+def generate_input(size: int, rng: Random) -> str:
+    """``size`` reports of 5 to 8 levels, walks of safe steps with the odd bad level mixed in."""
+    reports = []
+    for _ in range(size):
+        direction = rng.choice((1, -1))
+        levels = [rng.randint(20, 80)]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-3, 5)
+            levels.append(levels[-1] + step * direction)
+        reports.append(" ".join(map(str, levels)))
+
+    return "\n".join(reports)
 
 
 # -- Tests
@@ -52,6 +120,26 @@ def test_part_2() -> None:
     assert part_2(test_input) == 4
 
 
+def test_generate_input() -> None:
+    test_input = generate_input(200, Random(0))
+    assert 0 < part_1(test_input) < part_2(test_input) < 200
+
+
+def test_is_safe() -> None:
+    def brute_force(row: list[int], tolerance: int) -> bool:
+        return any(
+            check_row([level for i, level in enumerate(row) if i not in removed])
+            for count in range(tolerance + 1)
+            for removed in combinations(range(len(row)), count)
+        )
+
+    rng = Random(0)
+    for _ in range(500):
+        row = [rng.randint(1, 12) for _ in range(rng.randint(1, 8))]
+        for tolerance in range(4):
+            assert is_safe(row, tolerance) == brute_force(row, tolerance), (row, tolerance)
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
@@ -1,25 +1,127 @@
+import os
 import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import reduce
+from itertools import pairwise
 
-from utils import no_input_skip, read_input
+from utils import no_input_skip, read_file, read_input
+
+# Operands are 1-3 digits, so no instruction is longer than ``mul(123,456)``
+MUL = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do(?:n't)?)\(\)")
+LONGEST = len(b"mul(123,456)")
+
+
+@dataclass
+class Scan:
+    """What a stretch of memory adds up to, whatever state it is entered in.
+
+    ``before`` holds the products ahead of the first ``do()``/``don't()``, which only count if
+    the stretch is entered enabled, ``after`` the enabled products following it. ``enabled`` is
+    the state at the end, ``None`` if the stretch has no ``do()``/``don't()`` at all.
+    """
+
+    total: int = 0
+    before: int = 0
+    after: int = 0
+    enabled: bool | None = None
+
+    def add(self, instructions: Iterable[tuple[bytes, bytes, bytes]]) -> None:
+        total, before, after, enabled = self.total, self.before, self.after, self.enabled
+        for a, b, toggle in instructions:
+            if toggle:
+                enabled = toggle == b"do"
+                continue
+
+            value = int(a) * int(b)
+            total += value
+            if enabled is None:
+                before += value
+            elif enabled:
+                after += value
+
+        self.total, self.before, self.after, self.enabled = total, before, after, enabled
+
+    def then(self, other: "Scan") -> "Scan":
+        """This stretch followed by ``other``."""
+        if self.enabled is None:
+            return Scan(self.total + other.total, self.before + other.before, other.after, other.enabled)
+
+        after = self.after + other.before * self.enabled + other.after
+        enabled = self.enabled if other.enabled is None else other.enabled
+        return Scan(self.total + other.total, self.before, after, enabled)
+
+    def enabled_total(self, enabled: bool = True) -> int:
+        return self.before * enabled + self.after
+
+
+def scan(chunks: Iterable[bytes], limit: int | None = None) -> Scan:
+    """Scan memory arriving in chunks, only counting instructions that start before ``limit``.
+
+    Every instruction ends in ``)`` and has no other, so nothing straddles a cut made just after
+    the last ``)`` in the buffer, and at most the start of one instruction is carried over.
+    """
+    result = Scan()
+    carry, offset = b"", 0
+    for chunk in chunks:
+        buffer = carry + chunk
+        if limit is not None and offset + len(buffer) > limit:
+            # Past the limit, gather enough to finish what starts before it and stop
+            carry = buffer
+            if offset + len(buffer) >= limit + LONGEST - 1:
+                break
+            continue
+
+        cut = max(buffer.rfind(b")") + 1, len(buffer) - LONGEST + 1)
+        result.add(INSTRUCTION.findall(buffer, 0, cut))
+        carry, offset = buffer[cut:], offset + cut
+
+    if limit is not None:
+        matches = INSTRUCTION.finditer(carry)
+        result.add(match.groups() for match in matches if offset + match.start() < limit)  # type: ignore[misc]
+
+    return result
+
+
+def chunked(data: bytes | memoryview, size: int, start: int = 0, stop: int | None = None) -> Iterator[bytes]:
+    stop = len(data) if stop is None else min(stop, len(data))
+    for position in range(start, stop, size):
+        yield bytes(data[position : min(position + size, stop)])
+
+
+def scan_segment(path: str, start: int, stop: int, chunk_size: int) -> Scan:
+    """Instructions starting in ``[start, stop)``, reading on past ``stop`` to finish the last one."""
+    data = read_file(path, "bytes")
+    return scan(chunked(data, chunk_size, start, stop + LONGEST - 1), limit=stop - start)
+
+
+def segment_bounds(size: int, jobs: int) -> list[tuple[int, int]]:
+    return list(pairwise(size * job // max(jobs, 1) for job in range(max(jobs, 1) + 1)))
+
+
+def scan_file(path: str | os.PathLike[str], chunk_size: int = 1 << 20, jobs: int = 1) -> Scan:
+    """Scan a file in ``chunk_size`` pieces, split into ``jobs`` segments scanned in parallel.
+
+    Uncompressed files are memory mapped, so each worker only touches its own segment.
+    """
+    path = os.fspath(path)
+    segments = [(path, start, stop, chunk_size) for start, stop in segment_bounds(len(read_file(path, "bytes")), jobs)]
+    if jobs <= 1:
+        return reduce(Scan.then, (scan_segment(*segment) for segment in segments), Scan())
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return reduce(Scan.then, executor.map(scan_segment, *zip(*segments)), Scan())
 
 
 def part_1(puzzle: str) -> int:
-    return sum(int(a) * int(b) for a, b in re.findall(r"mul\((\d+),(\d+)\)", puzzle))
+    return sum(int(a) * int(b) for a, b in MUL.findall(puzzle.encode()))
 
 
 def part_2(puzzle: str) -> int:
-    working = True
-    total = 0
-    for match in re.finditer(r"mul\((\d+),(\d+)\)|(do\(\))|(don't\(\))", puzzle):
-        match [x for x in match.groups() if x is not None]:
-            case ["do()"]:
-                working = True
-            case ["don't()"]:
-                working = False
-            case [a, b]:
-                total += (int(a) * int(b)) * working
-
-    return total
+    return scan([puzzle.encode()]).enabled_total()
 
 
 # -- Tests
@@ -43,6 +145,26 @@ def test_part_2() -> None:
     assert part_2(test_input) == 48
 
 
+def test_scan_chunks() -> None:
+    memory = (get_example_input_part_1() + get_example_input_part_2()).encode() * 3
+    expected = scan([memory])
+    assert (expected.total, expected.enabled_total()) == (161 * 6, (161 + 48) * 3)
+    for size in range(1, 20):
+        assert scan(chunked(memory, size)) == expected
+
+
+def test_scan_file(tmp_path) -> None:
+    memory = (get_example_input_part_2() + get_example_input_part_1()).encode() * 7
+    path = tmp_path / "memory.txt"
+    path.write_bytes(memory)
+
+    expected = scan([memory])
+    for jobs in (1, 2, 5, 13):
+        segments = [scan_segment(str(path), start, stop, 16) for start, stop in segment_bounds(len(memory), jobs)]
+        assert reduce(Scan.then, segments, Scan()) == expected
+    assert scan_file(path, chunk_size=16) == expected
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
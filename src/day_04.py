@@ -1,63 +1,32 @@
-from collections import defaultdict
+from collections.abc import Iterable
 
-from utils import no_input_skip, read_input
+from utils import Grid, cached_parser, no_input_skip, phase, read_input
+from utils.grid import DIRECTIONS, stencil, word_stencils
 
 WORD_TO_FIND = "XMAS"
-WORD_LENGTH = len(WORD_TO_FIND)
 
+# An X of two MAS, in each of its four rotations
+X_MAS = [stencil(pattern) for pattern in ("M.S\n.A.\nM.S", "M.M\n.A.\nS.S", "S.M\n.A.\nS.M", "S.S\n.A.\nM.M")]
 
-def puzzle_to_grid(puzzle: str) -> dict:
-    grid = defaultdict(str)
-    lines = puzzle.split("\n")
 
-    for y, line in enumerate(lines):
-        for x, cell in enumerate(line):
-            grid[(x, y)] = cell
+@phase("parse")
+@cached_parser
+def puzzle_to_grid(puzzle: str) -> Grid:
+    # Padded for the longest sideways reach, a word of four letters
+    return Grid.from_puzzle(puzzle, pad=len(WORD_TO_FIND) - 1)
 
-    return grid
 
+def count_words(grid: Grid, words: Iterable[str]) -> dict[str, int]:
+    """Occurrences of each word in any of the eight directions, palindromes count both ways."""
+    return {word: grid.count(word_stencils(word)) for word in words}
 
-def part_1(puzzle: str) -> int:
-    grid = puzzle_to_grid(puzzle)
-
-    to_check = [list(WORD_TO_FIND), list(reversed(WORD_TO_FIND))]
-    found = 0
-
-    directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
-
-    for x, y in list(grid.keys()):
-        for dx, dy in directions:
-            if [grid[(x + i * dx, y + i * dy)] for i in range(WORD_LENGTH)] in to_check:
-                found += 1
 
-    return found
+def part_1(puzzle: str) -> int:
+    return count_words(puzzle_to_grid(puzzle), [WORD_TO_FIND])[WORD_TO_FIND]
 
 
 def part_2(puzzle: str) -> int:
-    grid = puzzle_to_grid(puzzle)
-
-    found = 0
-
-    to_check = [
-        ["M", "S", "A", "M", "S"],
-        ["S", "M", "A", "S", "M"],
-        ["M", "S", "A", "M", "s"],
-        ["S", "S", "A", "M", "M"],
-        ["M", "M", "A", "S", "S"],
-    ]
-
-    for x, y in list(grid.keys()):
-        selected = [
-            grid[(x, y)],
-            grid[(x + 2, y)],
-            grid[(x + 1, y + 1)],
-            grid[(x, y + 2)],
-            grid[(x + 2, y + 2)],
-        ]
-        if selected in to_check:
-            found += 1
-
-    return found
+    return puzzle_to_grid(puzzle).count(X_MAS)
 
 
 # -- Tests
@@ -86,6 +55,24 @@ def test_part_2() -> None:
     assert part_2(test_input) == 9
 
 
+def test_count_words() -> None:
+    lines = get_example_input().split("\n")
+    words = ["XMAS", "SAMX", "MAS", "AXA", "MM"]
+
+    def brute_force(word: str) -> int:
+        return sum(
+            all(
+                0 <= x + dx * i < len(lines[0]) and 0 <= y + dy * i < len(lines) and lines[y + dy * i][x + dx * i] == c
+                for i, c in enumerate(word)
+            )
+            for y in range(len(lines))
+            for x in range(len(lines[0]))
+            for dx, dy in DIRECTIONS
+        )
+
+    assert count_words(puzzle_to_grid(get_example_input()), words) == {word: brute_force(word) for word in words}
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
@@ -1,70 +1,133 @@
 from collections.abc import Iterable
+from random import Random
 
-from utils import no_input_skip, read_input
+from utils import NoSolutionError, input_generator, int_rows, no_input_skip, phase, read_input
 
 Rule = tuple[int, int]
 Pages = list[int]
 
 
+@phase("parse")
 def process_input(puzzle: str) -> tuple[Iterable[Rule], Iterable[Pages]]:
     ordering, pages = puzzle.strip().split("\n\n")
 
-    ordering_rules: list[tuple[int, int]] = []
-    for pair in ordering.split("\n"):
-        rules = pair.split("|")
-        ordering_rules.append((int(rules[0]), int(rules[1])))
-
-    processed_pages: list[Pages] = [[int(page) for page in row.split(",")] for row in pages.strip().split("\n")]
+    ordering_rules: list[Rule] = [(before, after) for before, after in int_rows(ordering, width=2)]
+    processed_pages: list[Pages] = [row.tolist() for row in int_rows(pages.strip())]
 
     return ordering_rules, processed_pages
 
 
-def in_order(ordering: Iterable[Rule], pages: Pages) -> bool:
-    for pos, page in enumerate(pages):
-        for pair in ordering:
-            if page == pair[1] and pair[0] in pages[pos + 1 :]:
+class RuleIndex:
+    """Ordering rules compiled to bitsets, one bit per page.
+
+    ``after[page]`` has the bits of the pages that must follow it and ``before[page]`` those
+    that must precede it, so the rules between an update's pages never have to be looked up.
+    """
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.bits: dict[int, int] = {}
+        self.after: dict[int, int] = {}
+        self.before: dict[int, int] = {}
+        for first, second in rules:
+            self.after[first] = self.after.get(first, 0) | self.bit(second)
+            self.before[second] = self.before.get(second, 0) | self.bit(first)
+
+    def bit(self, page: int) -> int:
+        return self.bits.setdefault(page, 1 << len(self.bits))
+
+    def mask(self, pages: Pages) -> int:
+        mask = 0
+        for page in pages:
+            mask |= self.bits.get(page, 0)
+        return mask
+
+    def in_order(self, pages: Pages) -> bool:
+        """No page comes after one it must precede, in O(k)."""
+        seen = 0
+        for page in pages:
+            if self.after.get(page, 0) & seen:
                 return False
-    return True
+            seen |= self.bits.get(page, 0)
 
+        return True
 
-def filter_orderings(ordering: Iterable[Rule], pages: Pages) -> list[tuple[int, int]]:
-    pages_set = set(pages)
-    return [pair for pair in ordering if pair[0] in pages_set and pair[1] in pages_set]
+    def reorder(self, pages: Pages) -> Pages:
+        """The pages in rule order.
 
+        When the rules order every pair of pages, as the puzzle's do, a page's place is simply
+        how many of the others must precede it, so sorting on that count needs no comparisons
+        between pages. If that doesn't give a valid order fall back to Kahn's algorithm.
+        """
+        mask = self.mask(pages)
+        ordered = sorted(pages, key=lambda page: (self.before.get(page, 0) & mask).bit_count())
 
-def reorder(ordering: Iterable[Rule], pages: Pages) -> Pages:
-    while not in_order(ordering, pages):
-        for pos, page in enumerate(pages):
-            for pair in ordering:
-                if page == pair[1] and (idx := pages.index(pair[0])) > pos:
-                    pages[pos], pages[idx] = pages[idx], pages[pos]  # noqa: PLR1736
+        return ordered if self.in_order(ordered) else self._kahn(pages, mask)
 
-    return pages
+    def _kahn(self, pages: Pages, mask: int) -> Pages:
+        ordered: Pages = []
+        placed = 0
+        remaining = dict.fromkeys(pages)
+        while remaining:
+            ready = [page for page in remaining if not self.before.get(page, 0) & mask & ~placed]
+            if not ready:
+                raise NoSolutionError()
+            for page in ready:
+                ordered.append(page)
+                placed |= self.bits.get(page, 0)
+                del remaining[page]
+
+        return ordered
+
+    def middle_pages(self, updates: Iterable[Pages]) -> tuple[int, int]:
+        """Sums of the middle pages of the updates already in order, and of the others once reordered."""
+        in_order = reordered = 0
+        for pages in updates:
+            if self.in_order(pages):
+                in_order += pages[len(pages) // 2]
+            else:
+                reordered += self.reorder(pages)[len(pages) // 2]
+
+        return in_order, reordered
 
 
 def part_1(puzzle: str) -> int:
     ordering, all_pages = process_input(puzzle)
 
-    total = 0
-    for pages in all_pages:
-        filtered_ordeing = filter_orderings(ordering, pages)
-        if in_order(filtered_ordeing, pages):
-            total += pages[len(pages) // 2]
+    index = RuleIndex(ordering)
 
-    return total
+    return sum(pages[len(pages) // 2] for pages in all_pages if index.in_order(pages))
 
 
 def part_2(puzzle: str) -> int:
     ordering, all_pages = process_input(puzzle)
+    index = RuleIndex(ordering)
+
+    return sum(index.reorder(pages)[len(pages) // 2] for pages in all_pages if not index.in_order(pages))
+
 
-    total = 0
-    for pages in all_pages:
-        filtered_ordeing = filter_orderings(ordering, pages)
-        if not in_order(filtered_ordeing, pages):
-            ordered = reorder(filtered_ordeing, pages)
-            total += ordered[len(pages) // 2]
+@input_generator
+def generate_input(size: int, rng: Random) -> str:
+    """Rules ordering pages 10-99 and ``size`` updates, roughly half of them out of order.
 
-    return total
+    Each page has rules against the 24 pages either side of it in a hidden order, and updates
+    are drawn from such a window, so every update has a single correct order.
+    """
+    window = 24
+    order = list(range(10, 100))
+    rng.shuffle(order)
+
+    rules = [f"{a}|{b}" for i, a in enumerate(order) for b in order[i + 1 : i + window + 1]]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(size):
+        start = rng.randrange(len(order) - window)
+        update = [order[i] for i in sorted(rng.sample(range(start, start + window + 1), rng.randrange(5, 24, 2)))]
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
 
 
 # -- Tests
@@ -112,6 +175,32 @@ def test_part_2() -> None:
     assert part_2(test_input) == 123
 
 
+def test_generate_input() -> None:
+    test_input = generate_input(50, Random(0))
+    assert part_1(test_input) > 0
+    assert part_2(test_input) > 0
+
+
+def test_rule_index() -> None:
+    ordering, all_pages = process_input(get_example_input())
+    index = RuleIndex(ordering)
+    assert index.middle_pages(all_pages) == (143, 123)
+    assert index.reorder([97, 13, 75, 29, 47]) == [97, 75, 47, 29, 13]
+
+    # 1 has more pages before it than 2 does, though it must come first, so this needs Kahn
+    partial = RuleIndex([(1, 2), (3, 1), (4, 1)])
+    assert partial.reorder([2, 1, 3, 4]) == [3, 4, 1, 2]
+    assert partial.in_order([4, 3, 1, 2])
+
+
+def test_rule_index_cycle() -> None:
+    # Third Party
+    import pytest
+
+    with pytest.raises(NoSolutionError):
+        RuleIndex([(1, 2), (2, 3), (3, 1)]).reorder([1, 2, 3])
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
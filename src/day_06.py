@@ -1,47 +1,44 @@
-from collections import deque
+from utils import Grid, cached_parser, instrument, no_input_skip, phase, read_input, slow
+from utils.grid import SENTINEL
 
-import pytest
-from rich.progress import Progress
+WALL = ord("#")
 
-from utils import no_input_skip, read_input
 
-Point = tuple[int, int]
+@phase("parse")
+@cached_parser
+def puzzle_to_map(puzzle: str) -> tuple[Grid, int]:
+    grid = Grid.from_puzzle(puzzle)
+    start = grid.cells.index(ord("^"))
+    grid.cells[start] = ord(".")
 
-
-def puzzle_to_map(puzzle: str) -> tuple[dict[Point, str], Point]:
-    puzzle_map = {}
-    start = (-1, -1)
-    for y, line in enumerate(puzzle.splitlines()):
-        for x, cell in enumerate(line):
-            if cell == "^":
-                start = (x, y)
-            puzzle_map[(x, y)] = "." if cell == "^" else cell
-
-    return puzzle_map, start
+    return grid, start
 
 
 class LoopingError(Exception):
     pass
 
 
-def walk_path(map: dict[Point, str], start: Point) -> set[Point]:
+def walk_path(grid: Grid, start: int) -> set[int]:
+    cells = grid.cells
+    offsets = grid.offsets
     position = start
-    directions = deque([(0, -1), (1, 0), (0, 1), (-1, 0)])
-    seen_directions: set[tuple[Point, Point]] = set()
-
-    try:
-        while True:
-            if (directions[0], position) in seen_directions:
-                raise LoopingError()
-            seen_directions.add((directions[0], position))
-            next_position = (position[0] + directions[0][0], position[1] + directions[0][1])
-            if map[next_position] == "#":
-                directions.rotate(-1)
-            else:
-                position = next_position
-    except KeyError:
-        pass
-
+    direction = 0
+    seen_directions: set[tuple[int, int]] = set()
+
+    while True:
+        if (direction, position) in seen_directions:
+            instrument.count("walk_path.loops")
+            raise LoopingError()
+        seen_directions.add((direction, position))
+        next_position = position + offsets[direction]
+        if cells[next_position] == WALL:
+            direction = (direction + 1) % 4
+        elif cells[next_position] == SENTINEL:
+            break
+        else:
+            position = next_position
+
+    instrument.observe("walk_path.steps", len(seen_directions))
     return {p for _, p in seen_directions}
 
 
@@ -53,6 +50,8 @@ def part_1(puzzle: str) -> int:
 
 
 def part_2(puzzle: str) -> int:
+    from rich.progress import Progress
+
     map, start_position = puzzle_to_map(puzzle)
     seen = walk_path(map, start_position)
 
@@ -61,12 +60,12 @@ def part_2(puzzle: str) -> int:
         task = progress.add_task("Obstructions", total=len(seen))
         for obstruction_position in seen:
             progress.update(task, advance=1)
-            map[obstruction_position] = "#"
+            map.cells[obstruction_position] = WALL
             try:
                 walk_path(map, start_position)
             except LoopingError:
                 loops += 1
-            map[obstruction_position] = "."
+            map.cells[obstruction_position] = ord(".")
 
     return loops
 
@@ -75,6 +74,8 @@ def part_2(puzzle: str) -> int:
 
 
 def test_looping_error():
+    import pytest
+
     puzzle = """....#.....
 ....+---+#
 ....|...|.
@@ -120,7 +121,7 @@ def test_part_1_real() -> None:
 
 
 @no_input_skip
-@pytest.mark.slow
+@slow
 def test_part_2_real() -> None:
     real_input = read_input(__file__)
     assert part_2(real_input) == 1984
@@ -2,9 +2,7 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from operator import add, mul
 
-import pytest
-
-from utils import no_input_skip, read_input
+from utils import int_rows, no_input_skip, read_input, slow
 
 
 @dataclass(frozen=True)
@@ -31,11 +29,8 @@ def is_valid(calibration: Calibration, operators: list[Callable]) -> bool:
 
 
 def parse_input(puzzle: str) -> Iterable[Calibration]:
-    for line in puzzle.splitlines():
-        parts = line.split(":")
-        answer = int(parts[0])
-        test_values = list(map(int, parts[1].split()))
-        yield Calibration(answer, test_values)
+    for row in int_rows(puzzle):
+        yield Calibration(row[0], row[1:].tolist())
 
 
 def part_1(puzzle: str) -> int:
@@ -98,7 +93,7 @@ def test_part_1_real() -> None:
 
 
 @no_input_skip
-@pytest.mark.slow
+@slow
 def test_part_2_real() -> None:
     real_input = read_input(__file__)
     assert part_2(real_input) == 328790210468594
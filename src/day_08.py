@@ -1,9 +1,10 @@
 from collections import defaultdict
 from itertools import combinations
 
-from utils import no_input_skip, read_input
+from utils import no_input_skip, phase, read_input
 
 
+@phase("parse")
 def parse_input(puzzle: str) -> tuple[dict[str, set[complex]], complex]:
     puzzle_map: dict[str, set[complex]] = defaultdict(set)
     for y, line in enumerate(puzzle.splitlines()):
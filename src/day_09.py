@@ -1,13 +1,11 @@
 from typing import Literal
 
-import pytest
-from rich.progress import Progress
-
-from utils import no_input_skip, read_input
+from utils import no_input_skip, phase, read_input, slow
 
 Block = int | Literal["."]
 
 
+@phase("parse")
 def parse_input(puzzle: str) -> list[Block]:
     blocks: list[Block] = []
     current_id = 0
@@ -40,6 +38,8 @@ def sort_blocks(blocks: list[Block]) -> list[Block]:
 
 
 def sort_files(blocks: list[Block]) -> list[Block]:
+    from rich.progress import Progress
+
     right = len(blocks) - 1
     moved: set[int] = set()
     first_space = 0
@@ -122,7 +122,7 @@ def test_part_1_real() -> None:
 
 
 @no_input_skip
-@pytest.mark.slow
+@slow
 def test_part_2_real() -> None:
     real_input = read_input(__file__)
     assert part_2(real_input) == 6286182965311
@@ -1,8 +1,10 @@
 from collections import defaultdict, deque
 
-from utils import no_input_skip, read_input
+from utils import cached_parser, no_input_skip, phase, read_input
 
 
+@phase("parse")
+@cached_parser
 def parse_input(puzzle: str) -> tuple[dict[complex, int], set[complex]]:
     trail_map: dict[complex, int] = defaultdict(int)
     starts: set[complex] = set()
@@ -1,13 +1,12 @@
-from functools import cache
-
-from utils import no_input_skip, read_input
+from utils import memo, no_input_skip, phase, read_input
 
 
+@phase("parse")
 def parse_input(puzzle: str) -> list[int]:
     return list(map(int, puzzle.split()))
 
 
-@cache
+@memo
 def blink(stone: int, itterations: int) -> int:
     if itterations == 0:
         return 1
@@ -1,9 +1,11 @@
 from collections import defaultdict, deque
 from collections.abc import Callable
 
-from utils import no_input_skip, read_input
+from utils import cached_parser, no_input_skip, phase, read_input
 
 
+@phase("parse")
+@cached_parser
 def parse_input(puzzle: str) -> dict[complex, str]:
     garden = defaultdict(str)
 
@@ -1,7 +1,6 @@
-import re
 from dataclasses import dataclass
 
-from utils import no_input_skip, read_input
+from utils import int_rows, no_input_skip, phase, read_input
 
 
 @dataclass(frozen=True)
@@ -27,20 +26,11 @@ class Game:
         return 0 if a_miss or b_miss else int(3 * a + b)
 
 
-def parse_line(line: str) -> complex:
-    number = re.compile(r"[\+\-]?\d+")
-    x, y = line.split(" ")[-2:]
-
-    return complex(int(number.findall(x)[0]), int(number.findall(y)[0]))
-
-
+@phase("parse")
 def parse_input(puzzle: str) -> list[Game]:
-    games: list[Game] = []
-    for parts in puzzle.split("\n\n"):
-        lines = map(parse_line, parts.splitlines())
-        games.append(Game(*lines))  # type: ignore[missing-argument]
-
-    return games
+    return [
+        Game(complex(ax, ay), complex(bx, by), complex(px, py)) for ax, ay, bx, by, px, py in int_rows(puzzle, width=6)
+    ]
 
 
 def part_1(puzzle: str) -> int:
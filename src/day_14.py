@@ -1,11 +1,10 @@
-import re
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import cached_property
 from itertools import count
 from math import prod
 
-from utils import ImposibleError, no_input_skip, read_input
+from utils import ImposibleError, int_rows, no_input_skip, phase, read_input
 
 
 @dataclass
@@ -49,17 +48,9 @@ class Extent:
         return (1 if robot.x < self.half_x else 2) + (4 if robot.y > self.half_y else 8)
 
 
+@phase("parse")
 def parse_input(puzzle: str) -> list[Robot]:
-    regex = re.compile(r"(-?\d+),(-?\d+)")
-
-    robots = []
-    for line in puzzle.splitlines():
-        parts = regex.findall(line)
-        px, py = int(parts[0][0]), int(parts[0][1])
-        vx, vy = (int(parts[1][0]), int(parts[1][1]))
-        robots.append(Robot(px, py, vx, vy))
-
-    return robots
+    return [Robot(px, py, vx, vy) for px, py, vx, vy in int_rows(puzzle, width=4)]
 
 
 def part_1(puzzle: str, extents: Extent = Extent(101, 103)) -> int:
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 
-from utils import no_input_skip, read_input
+from utils import no_input_skip, phase, read_input
 
 Robot = complex
 Box = complex
@@ -98,6 +98,7 @@ class Warehouse:
         return score
 
 
+@phase("parse")
 def parse_input(puzzle: str, double_wide: bool = False) -> tuple[Warehouse, list[Move]]:
     warehouse, moves = puzzle.split("\n\n")
     robot = complex(0, 0)
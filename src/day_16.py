@@ -1,90 +1,64 @@
-from collections import defaultdict
-from heapq import heappop, heappush
-from math import inf
+from utils import Grid, NoSolutionError, cached_parser, no_input_skip, phase, read_input, slow
+from utils.search import dijkstra
 
-import pytest
+WALL = ord("#")
+TURN_COST = 1000
 
-from utils import no_input_skip, read_input
 
+@phase("parse")
+@cached_parser
+def parse_input(puzzle: str) -> tuple[Grid, int, int]:
+    grid = Grid.from_puzzle(puzzle)
 
-def parse_input(puzzle: str) -> tuple[set[complex], complex, complex]:
-    walls = set()
+    return grid, grid.cells.index(ord("S")), grid.cells.index(ord("E"))
 
-    for y, line in enumerate(puzzle.split("\n")):
-        for x, cell in enumerate(line):
-            if cell == "#":
-                walls.add(complex(x, y))
-            elif cell == "S":
-                start = complex(x, y)
-            elif cell == "E":
-                end = complex(x, y)
-    return walls, start, end
 
+def solve_maze(grid: Grid, start: int, end: int) -> tuple[int, int]:
+    """Best score and number of tiles on any best path, states are ``cell index * 4 + direction``."""
+    cells = grid.cells
+    offsets = grid.offsets
 
-def solve_maze(walls: set[complex], start: complex, end: complex) -> tuple[int, int]:
-    directions = [complex(0, -1), complex(1, 0), complex(0, 1), complex(-1, 0)]
-    queue: list[tuple[int, float, float, float, float, set[complex]]] = []
-    heappush(queue, (0, start.real, start.imag, 1, 0, set()))
+    def neighbours(state: int) -> list[tuple[int, int]]:
+        position, direction = divmod(state, 4)
+        moves = [
+            (state - direction + (direction + 1) % 4, TURN_COST),
+            (state - direction + (direction - 1) % 4, TURN_COST),
+        ]
+        if cells[ahead := position + offsets[direction]] != WALL:
+            moves.append((ahead * 4 + direction, 1))
+        return moves
 
-    best_score = inf
-    scores_history: dict[int, set[complex]] = defaultdict(set)
-    visited: dict[tuple[complex, complex], int] = {}
+    result = dijkstra(
+        [start * 4 + 1],
+        neighbours,
+        lambda state: state // 4 == end,
+        size=len(cells) * 4,
+        all_paths=True,
+        name="solve_maze",
+    )
+    if result.goal is None:
+        raise NoSolutionError()
 
-    while queue:
-        score, x, y, dx, dy, history = heappop(queue)
-        position = complex(x, y)
-        direction = complex(dx, dy)
+    best_score = result.distance(result.goal)
+    ends = [end * 4 + direction for direction in range(4) if result.distance(end * 4 + direction) == best_score]
 
-        if score > best_score:
-            continue
-
-        visited[(position, direction)] = score
-
-        if position == end:
-            best_score = min(best_score, score)
-            scores_history[score] |= history
-
-        for next_direction in directions:
-            next_position = position + next_direction
-            if next_position in history or next_position in walls:
-                continue
-
-            next_score = score + 1
-            if next_direction != direction:
-                next_score += 1000
-
-            if (next_position, next_direction) in visited and visited[(next_position, next_direction)] < next_score:
-                continue
-
-            heappush(
-                queue,
-                (
-                    next_score,
-                    next_position.real,
-                    next_position.imag,
-                    next_direction.real,
-                    next_direction.imag,
-                    history | {position},
-                ),
-            )
-
-    return int(best_score), len(scores_history[int(best_score)]) + 1
+    return best_score, len({state // 4 for state in result.on_shortest_paths(ends)})
 
 
 def part_1(puzzle: str) -> int:
-    walls, start, end = parse_input(puzzle)
+    grid, start, end = parse_input(puzzle)
 
-    score, _ = solve_maze(walls, start, end)
+    score, _ = solve_maze(grid, start, end)
 
     return score
 
 
 def part_2(puzzle: str) -> int:
-    walls, start, end = parse_input(puzzle)
+    grid, start, end = parse_input(puzzle)
 
-    _, history = solve_maze(walls, start, end)
+    _, tiles = solve_maze(grid, start, end)
 
-    return history
+    return tiles
 
 
 # -- Tests
@@ -139,15 +113,23 @@ def test_part_2() -> None:
     assert part_2(test_input) == 45
 
 
+def test_no_path() -> None:
+    # Third Party
+    import pytest
+
+    with pytest.raises(NoSolutionError):
+        part_1("#####\n#S#E#\n#####")
+
+
 @no_input_skip
-@pytest.mark.slow
+@slow
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
     assert part_1(real_input) == 115500
 
 
 @no_input_skip
-@pytest.mark.slow
+@slow
 def test_part_2_real() -> None:
     real_input = read_input(__file__)
     assert part_2(real_input) == 679
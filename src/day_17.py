@@ -1,9 +1,10 @@
 from collections import defaultdict, deque
 from functools import partial
 
-from utils import NoSolutionError, no_input_skip, read_input
+from utils import NoSolutionError, no_input_skip, phase, read_input
 
 
+@phase("parse")
 def parse_input(puzzle: str) -> tuple[dict[str, int], list[int]]:
     raw_registers, raw_program = puzzle.split("\n\n")
     registers = defaultdict(int)
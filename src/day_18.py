@@ -1,43 +1,44 @@
-from heapq import heappop, heappush
+from utils import NoSolutionError, no_input_skip, phase, read_input
+from utils.search import bfs
 
-from utils import NoSolutionError, no_input_skip, read_input
+Point = tuple[int, int]
 
 
 class NoPathError(Exception):
     pass
 
 
-def parse_input(puzzle: str) -> list[complex]:
-    return [complex(int(x), int(y)) for x, y in (line.split(",") for line in puzzle.split("\n"))]
+@phase("parse")
+def parse_input(puzzle: str) -> list[Point]:
+    return [(int(x), int(y)) for x, y in (line.split(",") for line in puzzle.split("\n"))]
 
 
-def walk_path(bytes: list[complex], size: int) -> set[complex]:
-    visited: set[complex] = set()
-    queue: list[tuple[int, int, int, set[complex]]] = []
+def walk_path(bytes: list[Point], size: int) -> set[Point]:
+    """Cells on a shortest path from the top left to the bottom right, excluding the exit."""
+    width = size + 1
+    corrupted = bytearray(width * width)
+    for x, y in bytes:
+        corrupted[y * width + x] = 1
 
-    heappush(queue, (0, 0, 0, {complex(0, 0)}))
-    while queue:
-        dist, x, y, history = heappop(queue)
-        pos = complex(x, y)
+    def neighbours(state: int) -> list[int]:
+        y, x = divmod(state, width)
+        moves = []
+        if y > 0 and not corrupted[state - width]:
+            moves.append(state - width)
+        if x < size and not corrupted[state + 1]:
+            moves.append(state + 1)
+        if y < size and not corrupted[state + width]:
+            moves.append(state + width)
+        if x > 0 and not corrupted[state - 1]:
+            moves.append(state - 1)
+        return moves
 
-        if pos in visited or pos in bytes:
-            continue
+    goal = width * width - 1
+    result = bfs([0], neighbours, lambda state: state == goal, size=width * width, name="walk_path")
+    if result.goal is None:
+        raise NoPathError()
 
-        visited.add(pos)
-
-        if x == size and y == size:
-            return history
-
-        for direction in [complex(0, -1), complex(1, 0), complex(0, 1), complex(-1, 0)]:
-            next_pos = pos + direction
-
-            if next_pos.imag < 0 or next_pos.imag > size or next_pos.real < 0 or next_pos.real > size:
-                continue
-
-            if next_pos not in visited:
-                heappush(queue, (dist + 1, int(next_pos.real), int(next_pos.imag), history | {pos}))
-
-    raise NoPathError()
+    return {(state % width, state // width) for state in result.path()[:-1]}
 
 
 def part_1(puzzle: str, size: int = 70, sim_len: int = 1024) -> int:
@@ -63,7 +64,8 @@ def part_2(puzzle: str, size: int = 70, inital_sim_length: int = 1024) -> str:
     else:
         raise NoSolutionError()
 
-    return f"{int(bytes[sim_length-1].real)},{int(bytes[sim_length-1].imag)}"
+    x, y = bytes[sim_length - 1]
+    return f"{x},{y}"
 
 
 # -- Tests
@@ -1,8 +1,9 @@
 from functools import cache
 
-from utils import no_input_skip, read_input
+from utils import no_input_skip, phase, read_input
 
 
+@phase("parse")
 def parse_input(puzzle: str) -> tuple[set[str], list[str]]:
     towels, patterns = puzzle.split("\n\n")
 
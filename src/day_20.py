@@ -1,11 +1,13 @@
 from collections import defaultdict
 from itertools import combinations
+from math import isqrt
+from random import Random
 
-import pytest
-
-from utils import no_input_skip, read_input
+from utils import cached_parser, input_generator, no_input_skip, phase, read_input, slow
 
 
+@phase("parse")
+@cached_parser
 def parse_input(puzzle: str) -> list[tuple[int, int]]:
     track: set[complex] = set()
     start = complex(0, 0)
@@ -56,6 +58,28 @@ def part_2(puzzle: str) -> int:
     return sum(count for saving, count in cheats.items() if saving >= 100)
 
 
+@input_generator
+def generate_input(size: int, rng: Random) -> str:
+    """A racetrack of roughly ``size`` cells snaking back and forth across a square-ish grid.
+
+    Neighbouring lanes are only separated by a single wall, so every lane can cheat into the next.
+    """
+    width = max(3, isqrt(size) + rng.randint(-2, 2))
+    lanes = max(1, size // (width + 1))
+    grid = [["#"] * (width + 2) for _ in range(lanes * 2 + 1)]
+
+    for lane in range(lanes):
+        y = lane * 2 + 1
+        grid[y][1 : width + 1] = ["."] * width
+        if lane < lanes - 1:
+            grid[y + 1][width if lane % 2 == 0 else 1] = "."
+
+    grid[1][1] = "S"
+    grid[lanes * 2 - 1][width if lanes % 2 else 1] = "E"
+
+    return "\n".join("".join(row) for row in grid)
+
+
 # -- Tests
 
 
@@ -110,15 +134,21 @@ def test_part_2() -> None:
     assert over_50 == output
 
 
+def test_generate_input() -> None:
+    path = parse_input(generate_input(500, Random(0)))
+    assert 450 <= len(path) <= 550
+    assert count_cheets(path, 2, 1)
+
+
 @no_input_skip
-@pytest.mark.slow
+@slow
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
     assert part_1(real_input) == 1369
 
 
 @no_input_skip
-@pytest.mark.slow
+@slow
 def test_part_2_real() -> None:
     real_input = read_input(__file__)
     assert part_2(real_input) == 979012
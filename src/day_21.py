@@ -1,13 +1,10 @@
 from collections import UserDict
 from collections.abc import Generator, Mapping
-from functools import cache
 from heapq import heappop, heappush
 from itertools import pairwise
 from typing import Literal
 
-import pytest
-
-from utils import NoSolutionError, no_input_skip, read_input
+from utils import NoSolutionError, instrument, memo, no_input_skip, parametrize, read_input
 
 
 class KeypadDict(UserDict):
@@ -53,8 +50,10 @@ def find_paths(start: Point, end: Point, keypad: Keypad) -> Generator[str, None,
 
     while queue:
         dist, x, y, path, visited = heappop(queue)
+        instrument.count("find_paths.popped")
 
         if (x, y) == end:
+            instrument.count("find_paths.found")
             yield path + "A"
 
         for dir_x, dir_y, move, _ in directions:
@@ -64,7 +63,7 @@ def find_paths(start: Point, end: Point, keypad: Keypad) -> Generator[str, None,
                 heappush(queue, (dist + score, new_x, new_y, path + move, {*visited, (new_x, new_y)}))
 
 
-@cache
+@memo
 def get_path_between(start: str, end: str, keypad: Keypad, keypad_count: int) -> int:
     if not keypad_count:
         return 1
@@ -83,7 +82,7 @@ def get_path_between(start: str, end: str, keypad: Keypad, keypad_count: int) ->
     return shortest_path
 
 
-@cache
+@memo
 def get_path(keypad: Keypad, code: str, keypad_count: int) -> int:
     path: int = 0
     for a, b in pairwise("A" + code):
@@ -129,7 +128,7 @@ def test_part_1() -> None:
     assert part_1(test_input) == 126384
 
 
-@pytest.mark.parametrize(
+@parametrize(
     "test_input,expected",
     [
         ("029A", 68),
@@ -145,7 +144,7 @@ def test_single_code(test_input, expected):
     assert moves == expected
 
 
-@pytest.mark.parametrize(
+@parametrize(
     "test_input,expected",
     [
         ("382A", 68),
@@ -1,8 +1,6 @@
 from collections import defaultdict
 
-import pytest
-
-from utils import no_input_skip, read_input
+from utils import ints, no_input_skip, read_input, slow
 
 
 def secret_number(seed: int) -> int:
@@ -18,7 +16,7 @@ def secret_number(seed: int) -> int:
 def part_1(puzzle: str) -> int:
     numbers = []
 
-    for start in map(int, puzzle.splitlines()):
+    for start in ints(puzzle):
         number = start
         for _ in range(2000):
             number = secret_number(number)
@@ -30,7 +28,7 @@ def part_1(puzzle: str) -> int:
 def part_2(puzzle: str) -> int:
     bananas = defaultdict(int)
 
-    for start in map(int, puzzle.splitlines()):
+    for start in ints(puzzle):
         sequences = {}
         changes = []
         number = start
@@ -88,7 +86,7 @@ def test_part_1_real() -> None:
 
 
 @no_input_skip
-@pytest.mark.slow()
+@slow
 def test_part_2_real() -> None:
     real_input = read_input(__file__)
     assert part_2(real_input) == 2058
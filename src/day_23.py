@@ -1,11 +1,12 @@
 from collections import defaultdict
-from itertools import combinations
+from itertools import combinations, product
+from random import Random
+from string import ascii_lowercase
 
-import pytest
-
-from utils import no_input_skip, read_input
+from utils import input_generator, no_input_skip, phase, read_input, slow
 
 
+@phase("parse")
 def map_input(puzzle: str) -> dict[str, set[str]]:
     graph = defaultdict(set)
     pairs = [line.split("-") for line in puzzle.split("\n")]
@@ -58,6 +59,28 @@ def part_2(puzzle: str) -> str:
     return ",".join(sorted(biggest_group))
 
 
+@input_generator
+def generate_input(size: int, rng: Random) -> str:
+    """About ``size`` connections where every computer has 13 others, like the real input.
+
+    Computers sit on a shuffled ring, linked to the six after them and the one opposite, so the
+    work per computer stays fixed and only the number of computers grows.
+    """
+    computer_count = max(14, size * 2 // 13 // 2 * 2)
+    length = 2
+    while len(ascii_lowercase) ** length < computer_count:
+        length += 1
+    names = rng.sample(["".join(name) for name in product(ascii_lowercase, repeat=length)], computer_count)
+
+    connections = [
+        (names[i], names[(i + step) % computer_count]) for i in range(computer_count) for step in range(1, 7)
+    ]
+    connections += [(names[i], names[i + computer_count // 2]) for i in range(computer_count // 2)]
+    rng.shuffle(connections)
+
+    return "\n".join(f"{a}-{b}" for a, b in connections)
+
+
 # -- Tests
 
 
@@ -106,6 +129,12 @@ def test_part_2() -> None:
     assert part_2(test_input) == "co,de,ka,ta"
 
 
+def test_generate_input() -> None:
+    test_input = generate_input(200, Random(0))
+    assert all(len(nodes) == 13 for nodes in map_input(test_input).values())
+    assert len(part_2(test_input).split(",")) == 7
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
@@ -113,7 +142,7 @@ def test_part_1_real() -> None:
 
 
 @no_input_skip
-@pytest.mark.slow
+@slow
 def test_part_2_real() -> None:
     real_input = read_input(__file__)
     assert part_2(real_input) == "hl,io,ku,pk,ps,qq,sh,tx,ty,wq,xi,xj,yp"
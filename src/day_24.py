@@ -1,14 +1,13 @@
 from typing import Literal, cast
 
-import pytest
-
-from utils import ImposibleError, no_input_skip, read_input
+from utils import ImposibleError, no_input_skip, parametrize, phase, read_input
 
 Wire = str
 Op = Literal["AND", "OR", "XOR"]
 Rule = tuple[Wire, Op, Wire, Wire]
 
 
+@phase("parse")
 def parse_input(puzzle: str) -> tuple[dict[Wire, bool], dict[Wire, Rule]]:
     parts = puzzle.split("\n\n")
 
@@ -162,7 +161,7 @@ tgd XOR rvg -> z12
 tnw OR pbm -> gnj"""
 
 
-@pytest.mark.parametrize(
+@parametrize(
     "test_input, expected",
     [
         (get_small_example_input(), 4),
@@ -1,11 +1,12 @@
 from itertools import product
 
-from utils import no_input_skip, read_input
+from utils import no_input_skip, phase, read_input
 
 Lock = list[int]
 Key = list[int]
 
 
+@phase("parse")
 def parse_input(puzzle: str) -> tuple[list[Key], list[Lock]]:
     keys: list[Key] = []
     locks: list[Lock] = []
@@ -1,19 +1,99 @@
-# First Party
-from utils.collections import CachingDict
-from utils.contextmanagers import time_limit
-from utils.decorators import no_input_skip
-from utils.exceptions import ImposibleError, NoSolutionError
-from utils.helpers import ocr, read_input
-from utils.visualisers import GridType, draw_grid
+"""Shared helpers for the solutions.
+
+Names are imported lazily on first use, so a day only pays for the helpers it touches.
+"""
+
+# Standard Library
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # First Party
+    from utils import instrument
+    from utils.collections import CachingDict, SynchronizedCachingDict
+    from utils.contextmanagers import time_limit
+    from utils.decorators import no_input_skip, parametrize, slow
+    from utils.exceptions import ImposibleError, NoSolutionError, RowWidthError, TimeLimitError, UnsupportedFormatError
+    from utils.generators import input_generator
+    from utils.grid import Grid, GridView
+    from utils.helpers import ocr, read_file, read_input
+    from utils.memoize import memo
+    from utils.parse import int_rows, ints
+    from utils.parsecache import cached_parser
+    from utils.phases import phase
+    from utils.timing import Timing, measure
+    from utils.visualisers import GridType, draw_grid
+
+_LAZY = {
+    "CachingDict": "utils.collections",
+    "Grid": "utils.grid",
+    "GridType": "utils.visualisers",
+    "GridView": "utils.grid",
+    "ImposibleError": "utils.exceptions",
+    "NoSolutionError": "utils.exceptions",
+    "RowWidthError": "utils.exceptions",
+    "SynchronizedCachingDict": "utils.collections",
+    "TimeLimitError": "utils.exceptions",
+    "Timing": "utils.timing",
+    "UnsupportedFormatError": "utils.exceptions",
+    "cached_parser": "utils.parsecache",
+    "draw_grid": "utils.visualisers",
+    "input_generator": "utils.generators",
+    "instrument": "utils.instrument",
+    "int_rows": "utils.parse",
+    "ints": "utils.parse",
+    "measure": "utils.timing",
+    "memo": "utils.memoize",
+    "no_input_skip": "utils.decorators",
+    "ocr": "utils.helpers",
+    "parametrize": "utils.decorators",
+    "phase": "utils.phases",
+    "read_file": "utils.helpers",
+    "read_input": "utils.helpers",
+    "slow": "utils.decorators",
+    "time_limit": "utils.contextmanagers",
+}
 
 __all__ = [
     "CachingDict",
+    "Grid",
     "GridType",
+    "GridView",
     "ImposibleError",
     "NoSolutionError",
+    "RowWidthError",
+    "SynchronizedCachingDict",
+    "TimeLimitError",
+    "Timing",
+    "UnsupportedFormatError",
+    "cached_parser",
     "draw_grid",
+    "input_generator",
+    "instrument",
+    "int_rows",
+    "ints",
+    "measure",
+    "memo",
     "no_input_skip",
     "ocr",
+    "parametrize",
+    "phase",
+    "read_file",
     "read_input",
+    "slow",
     "time_limit",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(name)
+
+    module = import_module(_LAZY[name])
+    value = module if module.__name__ == f"{__name__}.{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
@@ -0,0 +1,195 @@
+# Standard Library
+import ast
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from types import ModuleType
+from typing import Any, NamedTuple
+
+FORMAT_VERSION = 1
+
+
+class Answer(NamedTuple):
+    value: Any
+    elapsed: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.elapsed is not None
+
+
+def _is_type_checking(test: ast.expr) -> bool:
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (
+        isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+    )
+
+
+def _runtime_nodes(node: ast.AST) -> Iterator[ast.AST]:
+    """Every node under ``node`` except the bodies of ``if TYPE_CHECKING:`` blocks."""
+    yield node
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.If) and _is_type_checking(child.test):
+            for other in child.orelse:
+                yield from _runtime_nodes(other)
+        else:
+            yield from _runtime_nodes(child)
+
+
+def _is_utils(name: str) -> bool:
+    return name.split(".")[0] == "utils"
+
+
+def _imported_utils(tree: ast.AST) -> list[str]:
+    names: list[str] = []
+    for node in _runtime_nodes(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+            names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+
+    return [name for name in names if _is_utils(name)]
+
+
+def _source(name: str) -> Path | None:
+    try:
+        spec = find_spec(name)
+    except ModuleNotFoundError:  # ``name`` is an attribute of a module, not a submodule
+        return None
+
+    return Path(spec.origin) if spec is not None and spec.origin is not None else None
+
+
+def _owner(name: str) -> str | None:
+    """The module that really defines attribute ``name``, following lazy ``__getattr__`` exports."""
+    module, _, attribute = name.rpartition(".")
+    try:
+        value = getattr(import_module(module), attribute)
+    except (ImportError, AttributeError):
+        return None
+
+    return value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+
+
+def module_sources(name: str) -> list[Path]:
+    """Source files of module ``name`` and every ``utils`` module it imports at runtime, directly or not.
+
+    Imports under ``if TYPE_CHECKING:`` are skipped, and names imported from a package are followed
+    to the module that defines them.
+    """
+    sources: dict[str, Path] = {}
+    seen: set[str] = set()
+    todo = [name]
+    while todo:
+        if (current := todo.pop()) in seen:
+            continue
+        seen.add(current)
+
+        if (path := _source(current)) is None:
+            if "." in current and (owner := _owner(current)) is not None and _is_utils(owner):
+                todo.append(owner)
+            continue
+
+        sources[current] = path
+        todo.extend(_imported_utils(ast.parse(path.read_bytes())))
+        if "." in current:
+            todo.append(current.rpartition(".")[0])
+
+    return sorted(sources.values())
+
+
+def answer_key(day: str, puzzle: str) -> str:
+    digest = hashlib.blake2b(puzzle.encode(), digest_size=16)
+    for path in module_sources(day):
+        digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    """Answers for each (day, part), valid while the day's ``answer_key`` is unchanged.
+
+    Only the latest answer per part is kept, in a single JSON file. Failed parts are never
+    stored. ``saved`` is the nanoseconds it took to originally compute every hit.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") == FORMAT_VERSION:
+            self._entries = data["answers"]
+
+    def get(self, day: str, part: int, key: str) -> Answer | None:
+        entry = self._entries.get(f"{day}:{part}")
+        if entry is None or entry["key"] != key:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.saved += entry["elapsed"]
+        return Answer(entry["value"], entry["elapsed"])
+
+    def put(self, day: str, part: int, key: str, answer: Answer) -> None:
+        if answer.ok:
+            self._entries[f"{day}:{part}"] = {"key": key, "value": answer.value, "elapsed": answer.elapsed}
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({"version": FORMAT_VERSION, "answers": self._entries}, indent=2))
+
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", Path(__file__).parent.parent.parent / ".cache"))
+
+
+# --- tests
+
+
+def test_module_sources() -> None:
+    sources = module_sources(__name__)
+    assert Path(__file__) in sources
+    assert Path(__file__).with_name("__init__.py") in sources
+
+
+def test_module_sources_runtime_only() -> None:
+    utils = Path(__file__).parent
+    sources = module_sources("day_04")
+    assert utils / "grid.py" in sources
+    assert utils / "parsecache.py" in sources
+    assert utils / "memoize.py" not in sources
+
+
+def test_answer_key() -> None:
+    assert answer_key(__name__, "1 2 3") == answer_key(__name__, "1 2 3")
+    assert answer_key(__name__, "1 2 3") != answer_key(__name__, "1 2 4")
+
+
+def test_answer_cache(tmp_path: Path) -> None:
+    path = tmp_path / "answers.json"
+    cache = AnswerCache(path)
+    cache.put("day_01", 1, "abc", Answer(42, 1_000))
+    cache.put("day_01", 2, "abc", Answer(0))
+    cache.save()
+
+    cache = AnswerCache(path)
+    assert cache.get("day_01", 1, "abc") == Answer(42, 1_000)
+    assert cache.get("day_01", 1, "def") is None
+    assert cache.get("day_01", 2, "abc") is None
+    assert (cache.hits, cache.misses, cache.saved) == (1, 2, 1_000)
+
+
+def test_answer_cache_corrupt(tmp_path: Path) -> None:
+    path = tmp_path / "answers.json"
+    path.write_text("{")
+    assert AnswerCache(path).get("day_01", 1, "abc") is None
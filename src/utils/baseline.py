@@ -0,0 +1,211 @@
+# Standard Library
+import hashlib
+import json
+import platform
+import subprocess
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from statistics import NormalDist
+
+# First Party
+from utils.exceptions import UnsupportedFormatError
+from utils.timing import Timing
+
+FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Result:
+    day: str
+    part: int
+    input_hash: str
+    timing: Timing
+    cache: str = "warm"
+
+
+@dataclass(frozen=True)
+class Comparison:
+    day: str
+    part: int
+    cache: str
+    baseline: Timing
+    current: Timing
+    p_value: float
+    input_changed: bool
+    missing: bool = False
+
+    @property
+    def broken(self) -> bool:
+        """OK in the baseline but missing, failing or timing out now."""
+        return self.missing or not self.current.ok
+
+    @property
+    def change(self) -> float:
+        if self.broken:
+            return float("inf")
+        if not self.baseline.median:
+            return 0.0 if not self.current.median else float("inf")
+        return self.current.median / self.baseline.median - 1
+
+    def significant(self, alpha: float) -> bool:
+        return self.p_value < alpha
+
+    def regressed(self, threshold: float, alpha: float) -> bool:
+        return self.broken or (self.change > threshold and self.significant(alpha))
+
+
+def hash_input(input_str: str) -> str:
+    return hashlib.sha256(input_str.encode()).hexdigest()[:16]
+
+
+def git_revision() -> str:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD"], check=False).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{revision}-dirty" if dirty else revision
+
+
+def save_results(path: Path, results: list[Result]) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "version": FORMAT_VERSION,
+                "revision": git_revision(),
+                "python": platform.python_version(),
+                "created": datetime.now(UTC).isoformat(),
+                "results": [
+                    {
+                        "day": result.day,
+                        "part": result.part,
+                        "cache": result.cache,
+                        "input_hash": result.input_hash,
+                        "samples": result.timing.samples,
+                        "outliers": result.timing.outliers,
+                        "error": result.timing.error,
+                    }
+                    for result in results
+                ],
+            },
+            indent=2,
+        )
+    )
+
+
+def load_results(path: Path) -> tuple[dict, dict[tuple[str, int, str], Result]]:
+    data = json.loads(path.read_text())
+    if data.get("version") != FORMAT_VERSION:
+        raise UnsupportedFormatError(path, data.get("version"))
+
+    results = {}
+    for row in data.pop("results"):
+        timing = Timing(row["samples"], row["outliers"], row["error"])
+        result = Result(row["day"], row["part"], row["input_hash"], timing, row.get("cache", "warm"))
+        results[(result.day, result.part, result.cache)] = result
+
+    return data, results
+
+
+def mann_whitney(a: list[int], b: list[int]) -> float:
+    """Two sided p-value of the Mann-Whitney U test, using the normal approximation."""
+    ranked = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    ranks = [0.0] * len(ranked)
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+
+    n1, n2 = len(a), len(b)
+    u = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0) - n1 * (n1 + 1) / 2
+    sigma = (n1 * n2 * (n1 + n2 + 1) / 12) ** 0.5
+    if not sigma:
+        return 1.0
+
+    z = (u - n1 * n2 / 2) / sigma
+    return 2 * (1 - NormalDist().cdf(abs(z)))
+
+
+def compare_results(
+    baseline: dict[tuple[str, int, str], Result], current: dict[tuple[str, int, str], Result]
+) -> list[Comparison]:
+    """Compare every part that was OK in the baseline, parts now broken or missing included."""
+    comparisons = []
+    for key in sorted(baseline.keys()):
+        base = baseline[key]
+        if not base.timing.ok:
+            continue
+
+        if (curr := current.get(key)) is None or not curr.timing.ok:
+            timing = Timing([], error="Missing from current run") if curr is None else curr.timing
+            comparisons.append(Comparison(*key, base.timing, timing, 0.0, False, missing=curr is None))
+            continue
+
+        comparisons.append(
+            Comparison(
+                *key,
+                base.timing,
+                curr.timing,
+                mann_whitney(base.timing.samples, curr.timing.samples),
+                base.input_hash != curr.input_hash,
+            )
+        )
+
+    return comparisons
+
+
+# --- tests
+
+
+def test_mann_whitney() -> None:
+    assert mann_whitney([1, 2, 3, 4, 5], [1, 2, 3, 4, 5]) == 1.0
+    assert mann_whitney([1, 2, 3, 4, 5, 6, 7, 8], [20, 21, 22, 23, 24, 25, 26, 27]) < 0.01
+
+
+def test_compare_results() -> None:
+    fast = Timing([10, 11, 10, 12, 11, 10, 11, 10])
+    slow = Timing([20, 21, 20, 22, 21, 20, 21, 20])
+    baseline = {("day_01", 1, "warm"): Result("day_01", 1, "abc", fast)}
+    current = {("day_01", 1, "warm"): Result("day_01", 1, "abc", slow)}
+
+    (comparison,) = compare_results(baseline, current)
+    assert comparison.regressed(threshold=0.1, alpha=0.05)
+    assert not comparison.input_changed
+    assert round(comparison.change, 2) == 0.95
+
+
+def test_compare_results_broken() -> None:
+    ok = Timing([10, 11, 10, 12])
+    baseline = {
+        ("day_01", 1, "warm"): Result("day_01", 1, "abc", ok),
+        ("day_01", 2, "warm"): Result("day_01", 2, "abc", ok),
+        ("day_02", 1, "warm"): Result("day_02", 1, "abc", Timing([0, 0, 0])),
+    }
+    current = {
+        ("day_01", 1, "warm"): Result("day_01", 1, "abc", Timing([], error="TimeLimitError: 1s")),
+        ("day_02", 1, "warm"): Result("day_02", 1, "abc", Timing([0, 0, 0])),
+    }
+
+    timed_out, missing, zero = compare_results(baseline, current)
+    assert timed_out.regressed(threshold=0.1, alpha=0.05)
+    assert missing.missing
+    assert missing.regressed(threshold=0.1, alpha=0.05)
+    assert zero.change == 0.0
+    assert not zero.regressed(threshold=0.1, alpha=0.05)
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    path = tmp_path / "bench.json"
+    save_results(path, [Result("day_01", 2, "abc", Timing([1, 2, 3], 1))])
+
+    meta, results = load_results(path)
+    assert meta["version"] == FORMAT_VERSION
+    assert results[("day_01", 2, "warm")].timing == Timing([1, 2, 3], 1)
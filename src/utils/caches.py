@@ -0,0 +1,109 @@
+# Standard Library
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from types import ModuleType
+from typing import Any
+
+# First Party
+from utils.collections import CachingDict
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    name: str
+    hits: int | None
+    misses: int | None
+    entries: int
+
+
+def is_cache(obj: Any) -> bool:
+    return not isinstance(obj, type) and callable(getattr(obj, "cache_clear", None))
+
+
+def find_caches(module: ModuleType) -> dict[str, Any]:
+    """Module level memoisation, anything with a ``cache_clear`` such as ``functools.cache`` or ``CachingDict``."""
+    return {name: obj for name, obj in vars(module).items() if is_cache(obj)}
+
+
+def clear_caches(caches: dict[str, Any]) -> None:
+    for obj in caches.values():
+        obj.cache_clear()
+
+
+def cache_stats(caches: dict[str, Any]) -> list[CacheStats]:
+    stats = []
+    for name, obj in caches.items():
+        if hasattr(obj, "cache_info"):
+            info = obj.cache_info()
+            stats.append(CacheStats(name, info.hits, info.misses, info.currsize))
+        else:
+            stats.append(CacheStats(name, None, None, len(obj)))
+
+    return stats
+
+
+def cache_memory(caches: dict[str, Any], func: Callable[..., Any], *args: Any) -> tuple[list[CacheStats], int]:
+    """Run ``func`` from cold caches, returning the cache stats and the bytes held by the caches.
+
+    The size is measured as the traced memory released by clearing the caches afterwards.
+    """
+    clear_caches(caches)
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        func(*args)
+        stats = cache_stats(caches)
+        before, _ = tracemalloc.get_traced_memory()
+        clear_caches(caches)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return stats, max(before - after, 0)
+
+
+# --- tests
+
+
+@cache
+def _square(n: int) -> int:
+    return n * n
+
+
+_doubles = CachingDict[int, int](lambda n: n * 2)
+
+
+def test_find_caches() -> None:
+    caches = find_caches(sys.modules[__name__])
+    assert caches["_square"] is _square
+    assert caches["_doubles"] is _doubles
+    assert "find_caches" not in caches
+    assert "CachingDict" not in caches
+
+
+def test_clear_caches() -> None:
+    caches = {"_square": _square, "_doubles": _doubles}
+    clear_caches(caches)
+    _square(2)
+    _square(2)
+    assert _doubles[3] == 6
+
+    stats = {s.name: s for s in cache_stats(caches)}
+    assert stats["_square"] == CacheStats("_square", 1, 1, 1)
+    assert stats["_doubles"] == CacheStats("_doubles", None, 1, 1)
+
+    clear_caches(caches)
+    assert _square.cache_info().currsize == 0
+    assert not _doubles
+
+
+def test_cache_memory() -> None:
+    caches = {"_square": _square}
+    stats, size = cache_memory(caches, lambda: [_square(n) for n in range(1000)])
+    assert stats == [CacheStats("_square", 0, 1000, 1000)]
+    assert size > 0
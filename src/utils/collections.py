@@ -1,23 +1,304 @@
 # Standard Library
+import sys
+import threading
 from collections.abc import Callable
-from typing import Generic, Self, TypeVar
+from typing import Any, Generic, Literal, NamedTuple, Self, TypeVar
 
 K = TypeVar("K")
 T = TypeVar("T")
 
 
+class CacheInfo(NamedTuple):
+    hits: int | None
+    misses: int
+    maxsize: int | None
+    currsize: int
+    evictions: int = 0
+
+
 class CachingDict(dict[K, T], Generic[K, T]):
+    """A ``dict`` that fills in missing keys with ``cache_factory(key)``.
+
+    Unbounded it is a plain ``dict`` with ``__missing__``, so hits are looked up at C speed and
+    not counted, ``cache_info().hits`` is ``None``. With a ``maxsize`` it evicts the least recently
+    (``"lru"``) or least frequently (``"lfu"``) used entry to make room, ties going to the oldest,
+    and counts hits like ``functools.lru_cache``. As there, ``maxsize=0`` caches nothing. Only item
+    access, assignment and ``del`` take part in the bookkeeping, so fill a bounded one through those
+    rather than ``update`` or ``setdefault``.
+    """
+
     cache_factory: Callable[[K], T]
+    _bounded: "type[_BoundedCachingDict[Any, Any]]"
+
+    def __new__(
+        cls, cache_factory: Callable[[K], T], maxsize: int | None = None, policy: Literal["lru", "lfu"] = "lru"
+    ) -> Self:
+        return super().__new__(cls if maxsize is None else cls._bounded)  # type: ignore[return-value]
 
-    def __init__(self: Self, cache_factory: Callable[[K], T]) -> None:
+    def __init__(
+        self: Self, cache_factory: Callable[[K], T], maxsize: int | None = None, policy: Literal["lru", "lfu"] = "lru"
+    ) -> None:
+        super().__init__()
         self.cache_factory = cache_factory
-        super(dict).__init__()
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits: int | None = None
+        self.misses = 0
+        self.evictions = 0
 
     def __missing__(self: Self, __key: K) -> T:
-        self.__setitem__(__key, self.cache_factory(__key))
-        return self[__key]
+        self.misses += 1
+        value = self.cache_factory(__key)
+        self[__key] = value
+        return value
+
+    def __reduce__(self: Self) -> tuple[Any, ...]:
+        # Rebuilt through the constructor, then the entries and counters restored in one go. The
+        # default dict reduce would fill the entries through ``__setitem__`` before there is state.
+        return type(self), (self.cache_factory, self.maxsize, self.policy), self.__getstate__()
+
+    def __getstate__(self: Self) -> tuple[dict[K, T], dict[str, Any]]:
+        return dict(self), dict(vars(self))
+
+    def __setstate__(self: Self, state: tuple[dict[K, T], dict[str, Any]]) -> None:
+        entries, attributes = state
+        dict.update(self, entries)
+        vars(self).update(attributes)
+
+    def cache_info(self: Self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self), self.evictions)
+
+    def cache_clear(self: Self) -> None:
+        self.clear()
+        self.misses = self.evictions = 0
+
+    def estimate_size(self: Self) -> int:
+        """Shallow size in bytes of the table, keys and values, not anything they refer to."""
+        return sys.getsizeof(self) + sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in self.items())
+
+
+class _BoundedCachingDict(CachingDict[K, T]):
+    """``CachingDict`` with a ``maxsize``, what ``CachingDict(..., maxsize=n)`` gives you."""
+
+    maxsize: int
+    hits: int
+
+    def __init__(
+        self: Self, cache_factory: Callable[[K], T], maxsize: int | None = None, policy: Literal["lru", "lfu"] = "lru"
+    ) -> None:
+        super().__init__(cache_factory, max(maxsize or 0, 0), policy)
+        self.hits = 0
+        self._uses: dict[K, int] = {}
+        self._by_uses: dict[int, dict[K, None]] = {}
+        self._least_uses = 0
+
+    def __getstate__(self: Self) -> tuple[dict[K, T], dict[str, Any]]:
+        entries, attributes = super().__getstate__()
+        attributes["_uses"] = dict(self._uses)
+        attributes["_by_uses"] = {uses: dict(keys) for uses, keys in self._by_uses.items()}
+        return entries, attributes
+
+    def __getitem__(self: Self, __key: K) -> T:
+        if not dict.__contains__(self, __key):
+            return self.__missing__(__key)
+
+        self.hits += 1
+        self._used(__key)
+        return dict.__getitem__(self, __key)
+
+    def __setitem__(self: Self, __key: K, __value: T) -> None:
+        if dict.__contains__(self, __key):
+            self._used(__key)
+        elif self.maxsize == 0:
+            return
+        else:
+            while len(self) >= self.maxsize:
+                self._evict()
+            self._added(__key)
+        dict.__setitem__(self, __key, __value)
+
+    def __delitem__(self: Self, __key: K) -> None:
+        dict.__delitem__(self, __key)
+        self._forget(__key)
+
+    def _used(self: Self, key: K) -> None:
+        if self.policy == "lru":
+            dict.__setitem__(self, key, dict.pop(self, key))
+            return
+
+        uses = self._uses[key]
+        self._forget(key)
+        self._uses[key] = uses + 1
+        self._by_uses.setdefault(uses + 1, {})[key] = None
+        if uses == self._least_uses and uses not in self._by_uses:
+            self._least_uses = uses + 1
+
+    def _added(self: Self, key: K) -> None:
+        if self.policy == "lfu":
+            self._uses[key] = 1
+            self._by_uses.setdefault(1, {})[key] = None
+            self._least_uses = 1
+
+    def _forget(self: Self, key: K) -> None:
+        if (uses := self._uses.pop(key, None)) is not None:
+            keys = self._by_uses[uses]
+            del keys[key]
+            if not keys:
+                del self._by_uses[uses]
+
+    def _evict(self: Self) -> None:
+        if self.policy == "lru":
+            key = next(iter(self))
+        else:
+            if self._least_uses not in self._by_uses:
+                self._least_uses = min(self._by_uses)
+            key = next(iter(self._by_uses[self._least_uses]))
+
+        del self[key]
+        self.evictions += 1
+
+    def cache_clear(self: Self) -> None:
+        super().cache_clear()
+        self._uses.clear()
+        self._by_uses.clear()
+        self.hits = 0
+
+
+CachingDict._bounded = _BoundedCachingDict
+
+
+class SynchronizedCachingDict(CachingDict[K, T]):
+    """``CachingDict`` safe to share between threads.
+
+    The factory runs under a re-entrant lock, so it may look up other keys recursively but
+    concurrent misses are computed one at a time.
+    """
+
+    def __init__(
+        self: Self, cache_factory: Callable[[K], T], maxsize: int | None = None, policy: Literal["lru", "lfu"] = "lru"
+    ) -> None:
+        super().__init__(cache_factory, maxsize, policy)
+        self._lock = threading.RLock()
+
+    def __getstate__(self: Self) -> tuple[dict[K, T], dict[str, Any]]:
+        with self._lock:
+            entries, attributes = super().__getstate__()
+        del attributes["_lock"]
+        return entries, attributes
+
+    def __getitem__(self: Self, __key: K) -> T:
+        with self._lock:
+            return super().__getitem__(__key)
+
+    def __setitem__(self: Self, __key: K, __value: T) -> None:
+        with self._lock:
+            super().__setitem__(__key, __value)
+
+    def __delitem__(self: Self, __key: K) -> None:
+        with self._lock:
+            super().__delitem__(__key)
+
+    def cache_clear(self: Self) -> None:
+        with self._lock:
+            super().cache_clear()
+
+
+class _SynchronizedBoundedCachingDict(SynchronizedCachingDict[K, T], _BoundedCachingDict[K, T]):
+    pass
+
+
+SynchronizedCachingDict._bounded = _SynchronizedBoundedCachingDict
+
+
+# --- tests
+
+
+def _square(n: int) -> int:
+    return n * n
+
+
+def test_caching_dict_copy_and_pickle() -> None:
+    # Standard Library
+    import copy
+    import pickle
+
+    originals = [
+        CachingDict[int, int](_square),
+        CachingDict[int, int](_square, maxsize=2),
+        CachingDict[int, int](_square, maxsize=2, policy="lfu"),
+        SynchronizedCachingDict[int, int](_square),
+        SynchronizedCachingDict[int, int](_square, maxsize=2),
+    ]
+    for original in originals:
+        original[1], original[2], original[1]
+        entries, info = list(original.items()), original.cache_info()
+        for clone in (copy.copy(original), copy.deepcopy(original), pickle.loads(pickle.dumps(original))):
+            assert type(clone) is type(original)
+            assert list(clone.items()) == entries
+            assert clone.cache_info() == info
+
+            clone[3], clone[4], clone[3]
+            assert list(original.items()) == entries
+            assert original.cache_info() == info
 
 
 def test_caching_dict() -> None:
-    test_dict = CachingDict[str, str](lambda key: f"{key}-{key}")
-    assert test_dict["test"] == "test-test"
+    calls: list[int] = []
+
+    def double(n: int) -> int:
+        calls.append(n)
+        return n * 2
+
+    doubles = CachingDict[int, int](double)
+    assert type(doubles) is CachingDict
+    assert doubles[2] == doubles[2] == 4
+    assert calls == [2]
+    assert doubles.cache_info() == CacheInfo(None, 1, None, 1)
+    assert doubles.estimate_size() > 0
+
+    doubles.cache_clear()
+    assert doubles.cache_info() == CacheInfo(None, 0, None, 0)
+
+
+def test_caching_dict_lru() -> None:
+    squares = CachingDict[int, int](lambda n: n * n, maxsize=2)
+    squares[1], squares[2], squares[1], squares[3]
+    assert list(squares) == [1, 3]
+    assert squares.cache_info() == CacheInfo(1, 3, 2, 2, 1)
+
+
+def test_caching_dict_lfu() -> None:
+    squares = CachingDict[int, int](lambda n: n * n, maxsize=2, policy="lfu")
+    squares[1], squares[1], squares[2], squares[3], squares[4]
+    assert sorted(squares) == [1, 4]
+    assert squares.evictions == 2
+
+    del squares[1]
+    squares[5], squares[6]
+    assert len(squares) == 2
+
+
+def test_caching_dict_maxsize_zero() -> None:
+    squares = CachingDict[int, int](lambda n: n * n, maxsize=0)
+    assert squares[3] == squares[3] == 9
+    assert squares.cache_info() == CacheInfo(0, 2, 0, 0)
+
+
+def test_synchronized_caching_dict() -> None:
+    def fib(n: int) -> int:
+        return n if n < 2 else fibs[n - 1] + fibs[n - 2]
+
+    fibs = SynchronizedCachingDict[int, int](fib)
+    threads = [threading.Thread(target=fibs.__getitem__, args=(n,)) for n in range(50, 100)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fibs[90] == 2880067194370816120
+    assert fibs.misses == 100
+
+    bounded = SynchronizedCachingDict[int, int](lambda n: n * n, maxsize=1)
+    bounded[1], bounded[2]
+    assert isinstance(bounded, SynchronizedCachingDict)
+    assert bounded.cache_info() == CacheInfo(0, 2, 1, 1, 1)
@@ -1,17 +1,217 @@
 # Standard Library
+import ctypes
 import signal
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter, sleep
+from types import FrameType
+from typing import Any
+
+# First Party
+from utils.exceptions import TimeLimitError
+
+
+@dataclass
+class Budget:
+    seconds: float
+    start: float = field(default_factory=perf_counter)
+    end: float | None = None
+    expired: bool = False
+
+    @property
+    def deadline(self) -> float:
+        return self.start + self.seconds
+
+    @property
+    def elapsed(self) -> float:
+        return (perf_counter() if self.end is None else self.end) - self.start
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.seconds - self.elapsed)
+
+    @property
+    def used(self) -> float:
+        """Fraction of the budget consumed, above 1 if the block overran."""
+        return self.elapsed / self.seconds
+
+
+@dataclass
+class _Alarm:
+    """Budgets open on the main thread and whatever was using ``SIGALRM`` before them."""
+
+    budgets: list[Budget] = field(default_factory=list)
+    handler: Any = None
+    timer: float = 0.0
+
+
+_alarm = _Alarm()
+_lock = threading.Lock()
+
+
+def _on_alarm(signum: int, frame: FrameType | None) -> None:
+    now = perf_counter()
+    # A closed budget is past raising for, even if its alarm was already pending
+    expired = [
+        budget for budget in _alarm.budgets if not budget.expired and budget.end is None and budget.deadline <= now
+    ]
+    for budget in expired:
+        budget.expired = True
+
+    _arm()
+    if expired:
+        raise TimeLimitError(expired[0].seconds)
+
+
+def _arm() -> None:
+    if pending := [budget.deadline for budget in _alarm.budgets if not budget.expired]:
+        signal.setitimer(signal.ITIMER_REAL, max(min(pending) - perf_counter(), 1e-6))
+    else:
+        signal.setitimer(signal.ITIMER_REAL, 0)
 
 
 @contextmanager
-def time_limit(seconds: int) -> Generator[None, None, None]:
-    def signal_handler(signum, frame) -> None:
-        raise TimeoutError
+def _main_thread_limit(budget: Budget) -> Generator[Budget, None, None]:
+    if not _alarm.budgets:
+        _alarm.timer, _ = signal.setitimer(signal.ITIMER_REAL, 0)
+        _alarm.handler = signal.signal(signal.SIGALRM, _on_alarm)
+
+    _alarm.budgets.append(budget)
+    _arm()
+    try:
+        yield budget
+    finally:
+        # Disarm first, an alarm going off part way through the cleanup would raise out of it
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        budget.end = perf_counter()
+        _alarm.budgets.remove(budget)
+        if _alarm.budgets:
+            _arm()
+        else:
+            signal.signal(signal.SIGALRM, _alarm.handler)
+            if _alarm.timer:
+                signal.setitimer(signal.ITIMER_REAL, max(_alarm.timer - budget.elapsed, 1e-6))
+
 
-    signal.signal(signal.SIGALRM, signal_handler)
-    signal.alarm(seconds)
+def _interrupt(thread_id: int, budget: Budget) -> None:
+    with _lock:
+        if budget.end is None:
+            budget.expired = True
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), ctypes.py_object(TimeLimitError))
+
+
+@contextmanager
+def _watchdog_limit(budget: Budget) -> Generator[Budget, None, None]:
+    watchdog = threading.Timer(budget.seconds, _interrupt, (threading.get_ident(), budget))
+    watchdog.daemon = True
+    watchdog.start()
     try:
-        yield
+        yield budget
     finally:
-        signal.alarm(0)
+        with _lock:
+            budget.end = perf_counter()
+        watchdog.cancel()
+
+
+@contextmanager
+def time_limit(seconds: float) -> Generator[Budget, None, None]:
+    """Raise ``TimeLimitError`` in the block once ``seconds`` have passed, yielding its ``Budget``.
+
+    Limits nest, the earliest deadline wins, and the budget records how much of it was used. On
+    the main thread a ``setitimer`` alarm is used, restoring any earlier ``SIGALRM`` handler and
+    timer afterwards. Other threads get a watchdog that raises asynchronously, which can't
+    interrupt a blocking call in C until it returns. ``TimeLimitError`` is a ``TimeoutError``.
+    """
+    budget = Budget(seconds)
+    if threading.current_thread() is threading.main_thread():
+        with _main_thread_limit(budget):
+            yield budget
+    else:
+        with _watchdog_limit(budget):
+            yield budget
+
+
+# --- tests
+
+
+def _spin(seconds: float) -> None:
+    deadline = perf_counter() + seconds
+    while perf_counter() < deadline:
+        pass
+
+
+def test_time_limit() -> None:
+    # Third Party
+    import pytest
+
+    with time_limit(0.5) as budget:
+        _spin(0.01)
+
+    assert not budget.expired
+    assert 0 < budget.used < 1
+
+    with pytest.raises(TimeoutError), time_limit(0.05) as budget:
+        sleep(1)
+
+    assert budget.expired
+    assert 0.05 <= budget.elapsed < 0.5
+
+
+def test_time_limit_nested() -> None:
+    # Third Party
+    import pytest
+
+    with time_limit(1) as outer:
+        with pytest.raises(TimeoutError), time_limit(0.05) as inner:
+            _spin(1)
+        _spin(0.01)
+
+    assert inner.expired
+    assert not outer.expired
+
+    with pytest.raises(TimeoutError), time_limit(0.05) as outer, time_limit(1) as inner:
+        _spin(1)
+
+    assert outer.expired
+    assert not inner.expired
+
+
+def test_time_limit_cleanup_not_interrupted() -> None:
+    class SlowRemove(list[Budget]):
+        def remove(self, budget: Budget) -> None:
+            sleep(0.05)
+            super().remove(budget)
+
+    handler = signal.getsignal(signal.SIGALRM)
+    _alarm.budgets = SlowRemove()
+    try:
+        with time_limit(0.01) as budget:
+            pass
+    finally:
+        _alarm.budgets = []
+
+    assert not budget.expired
+    assert signal.getsignal(signal.SIGALRM) is handler
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+def test_time_limit_thread() -> None:
+    budgets: list[Budget] = []
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        try:
+            with time_limit(0.05) as budget:
+                budgets.append(budget)
+                _spin(1)
+        except TimeoutError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert budgets[0].expired
+    assert len(errors) == 1
@@ -1,10 +1,10 @@
 # Standard Library
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Sequence
 from functools import wraps
-from typing import Any
+from typing import Any, TypeVar
 
-# Third Party
-import pytest
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 def no_input_skip(f: Callable[..., Any]) -> Callable[..., Any]:
@@ -13,6 +13,35 @@ def no_input_skip(f: Callable[..., Any]) -> Callable[..., Any]:
         try:
             return f(*args, **kwargs)
         except FileNotFoundError:
+            # Third Party
+            import pytest
+
             pytest.skip("Input file not found")  # ty: ignore[call-non-callable]
 
     return wrapper
+
+
+def slow(f: F) -> F:
+    """``pytest.mark.slow``, only applied under pytest so solutions never have to import it."""
+    if "pytest" not in sys.modules:
+        return f
+
+    # Third Party
+    import pytest
+
+    return pytest.mark.slow(f)
+
+
+def parametrize(argnames: str, argvalues: Sequence[Any]) -> Callable[[F], F]:
+    """``pytest.mark.parametrize``, only applied under pytest like ``slow``."""
+
+    def decorator(f: F) -> F:
+        if "pytest" not in sys.modules:
+            return f
+
+        # Third Party
+        import pytest
+
+        return pytest.mark.parametrize(argnames, argvalues)(f)
+
+    return decorator
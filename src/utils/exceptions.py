@@ -4,3 +4,15 @@ class ImposibleError(Exception):
 
 class NoSolutionError(Exception):
     pass
+
+
+class UnsupportedFormatError(Exception):
+    pass
+
+
+class TimeLimitError(TimeoutError):
+    pass
+
+
+class RowWidthError(ValueError):
+    pass
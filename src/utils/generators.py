@@ -0,0 +1,68 @@
+# Standard Library
+from collections.abc import Callable
+from importlib import import_module
+from math import log
+from random import Random
+
+InputGenerator = Callable[[int, Random], str]
+
+GENERATORS: dict[str, InputGenerator] = {}
+
+
+def input_generator(func: InputGenerator) -> InputGenerator:
+    """Register ``func(size, rng)`` as the synthetic input generator for the day it is defined in."""
+    GENERATORS[func.__module__] = func
+    return func
+
+
+def generate_input(day: str, size: int, seed: int = 0) -> str:
+    import_module(day)
+    return GENERATORS[day](size, Random(seed))
+
+
+def parse_size(size: str) -> int:
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    size = size.strip().lower()
+    if size and size[-1] in multipliers:
+        return int(float(size[:-1]) * multipliers[size[-1]])
+    return int(size)
+
+
+def fit_exponent(sizes: list[int], values: list[float]) -> float:
+    """Least squares slope of log(value) against log(size), i.e. k in value ~ size^k."""
+    points = [(log(size), log(value)) for size, value in zip(sizes, values) if size > 0 and value > 0]
+    if len(points) < 2:
+        return float("nan")
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return float("nan")
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+# --- tests
+
+
+def test_parse_size() -> None:
+    assert parse_size("100") == 100
+    assert parse_size("10k") == 10_000
+    assert parse_size("1.5M") == 1_500_000
+
+
+def test_fit_exponent() -> None:
+    sizes = [10, 100, 1000]
+    assert round(fit_exponent(sizes, [s * 3 for s in sizes]), 6) == 1
+    assert round(fit_exponent(sizes, [s**2 for s in sizes]), 6) == 2
+
+
+def test_input_generator() -> None:
+    @input_generator
+    def generator(size: int, rng: Random) -> str:
+        return "\n".join(str(rng.randint(0, 9)) for _ in range(size))
+
+    assert GENERATORS[__name__] is generator
+    assert generate_input(__name__, 5, seed=1) == generate_input(__name__, 5, seed=1)
+    assert len(generate_input(__name__, 5).splitlines()) == 5
@@ -0,0 +1,242 @@
+# Standard Library
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from typing import Self
+
+Point = tuple[int, int]
+Stencil = Mapping[Point, str]
+
+SENTINEL = ord("\n")
+
+DIRECTIONS = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+
+
+def stencil(pattern: str, wildcard: str = ".") -> dict[Point, str]:
+    """Offsets of the non ``wildcard`` characters in a multi-line pattern, from its top left."""
+    return {
+        (x, y): char for y, line in enumerate(pattern.split("\n")) for x, char in enumerate(line) if char != wildcard
+    }
+
+
+def word_stencils(word: str) -> list[dict[Point, str]]:
+    """``word`` spelt out from its first letter in each of the eight directions."""
+    return [{(dx * i, dy * i): char for i, char in enumerate(word)} for dx, dy in DIRECTIONS]
+
+
+class Grid:
+    """Rectangular character grid stored row by row in one flat ``bytearray``.
+
+    Each row is followed by ``pad`` sentinel bytes, and ``pad`` sentinel rows sit above and
+    below, so any cell up to ``pad`` steps outside the grid reads as ``SENTINEL`` and walks need
+    no bounds checks. With the default padding of one that is exactly the puzzle's own layout,
+    newlines and all. Hot loops should work on ``cells`` with indices from ``index`` and steps
+    from ``offsets``, ``grid[x, y]`` and ``view()`` are there for convenience and migration.
+    """
+
+    __slots__ = ("cells", "height", "pad", "stride", "width")
+
+    def __init__(self, width: int, height: int, cells: bytearray, pad: int = 1) -> None:
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + pad
+        self.cells = cells
+
+    @classmethod
+    def from_puzzle(cls, puzzle: str | bytes, pad: int = 1) -> Self:
+        """Grid of a puzzle's lines, copied once into a preallocated ``bytearray`` of sentinels."""
+        data = puzzle.encode() if isinstance(puzzle, str) else puzzle
+        if (width := data.find(b"\n")) < 0:
+            width = len(data)
+        height = data.count(b"\n") + 1
+
+        stride = width + pad
+        cells = bytearray([SENTINEL]) * (stride * (height + 2 * pad))
+        if pad == 1:
+            # The puzzle's own newlines are the row separators, so the body goes in whole
+            cells[stride : stride + len(data)] = data
+        else:
+            rows = memoryview(data)
+            for y in range(height):
+                start = (y + pad) * stride
+                cells[start : start + width] = rows[y * (width + 1) : y * (width + 1) + width]
+        return cls(width, height, cells, pad)
+
+    @property
+    def offsets(self) -> tuple[int, int, int, int]:
+        """Index steps for up, right, down and left, turning clockwise."""
+        return -self.stride, 1, self.stride, -1
+
+    @property
+    def diagonal_offsets(self) -> tuple[int, int, int, int]:
+        return -self.stride + 1, self.stride + 1, self.stride - 1, -self.stride - 1
+
+    def index(self, x: int, y: int) -> int:
+        return (y + self.pad) * self.stride + x
+
+    def point(self, index: int) -> Point:
+        y, x = divmod(index, self.stride)
+        return x, y - self.pad
+
+    def indices(self) -> Iterator[int]:
+        """Index of every cell inside the grid, row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def neighbours(self, index: int) -> Iterator[int]:
+        """Orthogonal neighbours of ``index`` that are inside the grid."""
+        cells = self.cells
+        for offset in self.offsets:
+            if cells[index + offset] != SENTINEL:
+                yield index + offset
+
+    def find(self, char: str) -> Point | None:
+        index = self.cells.find(ord(char))
+        return None if index == -1 else self.point(index)
+
+    def find_all(self, char: str) -> list[Point]:
+        value = ord(char)
+        found = []
+        index = self.cells.find(value)
+        while index != -1:
+            found.append(self.point(index))
+            index = self.cells.find(value, index + 1)
+
+        return found
+
+    def __contains__(self, point: Point) -> bool:
+        x, y = point
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, point: Point) -> str:
+        return chr(self.cells[self.index(*point)])
+
+    def __setitem__(self, point: Point, value: str) -> None:
+        self.cells[self.index(*point)] = ord(value)
+
+    def count(self, stencils: Iterable[Stencil], band: int = 1 << 22) -> int:
+        """How many placements of the stencils match the grid, summed over the stencils.
+
+        Every character becomes one big int with a byte per cell, set to 1 where the cell holds
+        it, so shifting and ANDing those compares every placement at once. The grid is worked
+        through in bands of ``band`` cells to bound memory. A stencil mustn't reach further
+        sideways than ``pad``, or placements would wrap into the next row.
+        """
+        placements = []
+        for pattern in stencils:
+            offsets = [(dy * self.stride + dx, ord(char)) for (dx, dy), char in pattern.items()]
+            first = min(offset for offset, _ in offsets)
+            placements.append([(offset - first, char) for offset, char in offsets])
+        span = max((offset for offsets in placements for offset, _ in offsets), default=0)
+
+        total = 0
+        for start in range(0, len(self.cells), band):
+            window = self.cells[start : start + band + span]
+            anchors = (1 << (8 * min(band, len(self.cells) - start))) - 1
+            masks: dict[int, int] = {}
+            for offsets in placements:
+                found = anchors
+                for offset, char in offsets:
+                    if char not in masks:
+                        table = bytearray(256)
+                        table[char] = 1
+                        masks[char] = int.from_bytes(window.translate(table), "little")
+                    found &= masks[char] >> (8 * offset)
+                total += found.bit_count()
+
+        return total
+
+    def copy(self) -> Self:
+        return type(self)(self.width, self.height, self.cells.copy(), self.pad)
+
+    def view(self) -> "GridView":
+        return GridView(self)
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[self.index(0, y) : self.index(0, y) + self.width].decode() for y in range(self.height)
+        )
+
+
+class GridView(MutableMapping[Point, str]):
+    """``dict[Point, str]`` interface onto a ``Grid``, for code still written against dicts.
+
+    Reads outside the grid raise ``KeyError`` like a missing dict key. Cells can't be added or
+    deleted, so writes outside the grid and deletes raise ``KeyError`` as well.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+
+    def __getitem__(self, point: Point) -> str:
+        if point not in self.grid:
+            raise KeyError(point)
+        return self.grid[point]
+
+    def __setitem__(self, point: Point, value: str) -> None:
+        if point not in self.grid:
+            raise KeyError(point)
+        self.grid[point] = value
+
+    def __delitem__(self, point: Point) -> None:
+        raise KeyError(point)
+
+    def __contains__(self, point: object) -> bool:
+        return isinstance(point, tuple) and point in self.grid
+
+    def __iter__(self) -> Iterator[Point]:
+        return ((x, y) for y in range(self.grid.height) for x in range(self.grid.width))
+
+    def __len__(self) -> int:
+        return self.grid.width * self.grid.height
+
+
+# --- tests
+
+EXAMPLE = "#.S\n..#\nE.."
+
+
+def test_grid() -> None:
+    grid = Grid.from_puzzle(EXAMPLE)
+    assert (grid.width, grid.height) == (3, 3)
+    assert grid[2, 0] == "S"
+    assert grid.point(grid.index(1, 2)) == (1, 2)
+    assert str(grid) == EXAMPLE
+
+    grid[1, 1] = "#"
+    assert grid.find_all("#") == [(0, 0), (1, 1), (2, 1)]
+    assert grid.find("E") == (0, 2)
+    assert grid.find("X") is None
+
+
+def test_grid_padding() -> None:
+    for pad in (1, 3):
+        grid = Grid.from_puzzle(EXAMPLE, pad=pad)
+        start = grid.index(0, 0)
+        assert str(grid) == EXAMPLE
+        up, _, _, left = grid.offsets
+        assert all(grid.cells[start + step * pad] == SENTINEL for step in (up, left, up + left))
+        assert sorted(map(grid.point, grid.neighbours(start))) == [(0, 1), (1, 0)]
+        assert len(list(grid.indices())) == 9
+
+
+def test_grid_count() -> None:
+    grid = Grid.from_puzzle("ABA\nBAB\nABA", pad=2)
+    assert grid.count([stencil("A")]) == 5
+    assert grid.count([stencil("A.A\n.B.")]) == 0
+    assert grid.count([stencil("A.A\n...\nA.A")]) == 1
+    assert grid.count(word_stencils("AB")) == 12
+    assert grid.count(word_stencils("ABA")) == 8
+    for band in (1, 4, 7):
+        assert grid.count(word_stencils("AB"), band=band) == 12
+
+
+def test_grid_view() -> None:
+    view = Grid.from_puzzle(EXAMPLE).view()
+    assert view[2, 0] == "S"
+    assert view.get((3, 0)) is None
+    assert (3, 0) not in view
+    assert len(view) == len(dict(view)) == 9
+
+    view[0, 0] = "."
+    assert view.grid[0, 0] == "."
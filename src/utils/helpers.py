@@ -1,12 +1,103 @@
 # Standard Library
+import bz2
+import gzip
+import lzma
+import mmap
 import os
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Any, Literal, overload
 
+INPUTS_ENV = "AOC_INPUTS_DIR"
 
-def read_input(day: str) -> str:
-    file = os.path.splitext(os.path.basename(day))[0]
-    with open(os.path.join(os.path.dirname(__file__), "..", "..", "inputs", f"{file}.txt")) as f:
-        return f.read().rstrip().rstrip("\n\r")
+Mode = Literal["text", "bytes", "lines"]
+
+OPENERS: dict[str, Callable[..., IO[Any]]] = {".gz": gzip.open, ".xz": lzma.open, ".bz2": bz2.open}
+
+
+def inputs_dir() -> str:
+    """``$AOC_INPUTS_DIR``, or the repo's ``inputs`` directory."""
+    return os.environ.get(INPUTS_ENV) or os.path.join(os.path.dirname(__file__), "..", "..", "inputs")
+
+
+def input_path(day: str) -> str:
+    """Path to a day's input, ``day_01.txt`` or a compressed ``day_01.txt.gz``, ``.xz`` or ``.bz2``."""
+    file = os.path.join(inputs_dir(), f"{os.path.splitext(os.path.basename(day))[0]}.txt")
+    for suffix in ("", *OPENERS):
+        if os.path.exists(file + suffix):
+            return file + suffix
+
+    return file
+
+
+def _open(path: str, binary: bool) -> IO[Any]:
+    opener = OPENERS.get(os.path.splitext(path)[1], open)
+    return opener(path, "rb" if binary else "rt")
+
+
+def _stripped(data: bytes | mmap.mmap) -> memoryview:
+    end = len(data)
+    while end and data[end - 1] in b" \t\r\n":
+        end -= 1
+
+    return memoryview(data)[:end]
+
+
+def _read_bytes(path: str) -> memoryview:
+    if os.path.splitext(path)[1] in OPENERS:
+        with _open(path, binary=True) as f:
+            return _stripped(f.read())
+
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return memoryview(b"")
+        # The view keeps the mapping alive after the file is closed
+        return _stripped(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _read_lines(path: str) -> Iterator[str]:
+    with _open(path, binary=False) as f:
+        blank = 0
+        for line in f:
+            if not (line := line.rstrip("\r\n")):
+                blank += 1
+                continue
+            yield from [""] * blank
+            blank = 0
+            yield line
+
+
+@overload
+def read_file(path: str | os.PathLike[str], mode: Literal["text"] = "text") -> str: ...
+@overload
+def read_file(path: str | os.PathLike[str], mode: Literal["bytes"]) -> memoryview: ...
+@overload
+def read_file(path: str | os.PathLike[str], mode: Literal["lines"]) -> Iterator[str]: ...
+def read_file(path: str | os.PathLike[str], mode: Mode = "text") -> str | memoryview | Iterator[str]:
+    """Read a puzzle input, decompressing ``.gz``, ``.xz`` and ``.bz2`` files on the fly.
+
+    ``text`` is the whole file with trailing whitespace stripped. ``bytes`` is a read only
+    ``memoryview`` of the same, memory mapped rather than copied for uncompressed files. ``lines``
+    lazily yields lines without their newlines, and without trailing blank lines.
+    """
+    path = os.fspath(path)
+    if mode == "bytes":
+        return _read_bytes(path)
+    if mode == "lines":
+        return _read_lines(path)
+
+    with _open(path, binary=False) as f:
+        return f.read().rstrip()
+
+
+@overload
+def read_input(day: str, mode: Literal["text"] = "text") -> str: ...
+@overload
+def read_input(day: str, mode: Literal["bytes"]) -> memoryview: ...
+@overload
+def read_input(day: str, mode: Literal["lines"]) -> Iterator[str]: ...
+def read_input(day: str, mode: Mode = "text") -> str | memoryview | Iterator[str]:
+    """Read a day's input, from ``__file__`` or a day name, see ``read_file`` for the modes."""
+    return read_file(input_path(day), mode)
 
 
 def input_to_ints(input: str) -> list[int]:
@@ -68,6 +159,28 @@ def test_input_to_ints():
     assert input_to_ints(test_input) == [123, 456, 12]
 
 
+def test_read_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(INPUTS_ENV, str(tmp_path))
+    text = "123\n\n456\n012\n\n"
+    (tmp_path / "day_00.txt").write_text(text)
+    with gzip.open(tmp_path / "day_01.txt.gz", "wt") as f:
+        f.write(text)
+
+    for day in ("day_00", "day_01.py"):
+        path = input_path(day)
+        assert path.endswith(".txt" if day == "day_00" else ".txt.gz")
+        assert read_file(path) == "123\n\n456\n012"
+        assert bytes(read_file(path, "bytes")) == b"123\n\n456\n012"
+        assert list(read_file(path, "lines")) == ["123", "", "456", "012"]
+
+
+def test_read_input_root(tmp_path, monkeypatch):
+    (tmp_path / "day_00.txt").write_bytes(b"")
+    monkeypatch.setenv(INPUTS_ENV, str(tmp_path))
+    assert read_input("day_00.py") == ""
+    assert read_input("day_00.py", "bytes") == b""
+
+
 def test_ints_to_input():
     ints = [123, 456, 12]
     assert ints_to_input(ints) == "123\n456\n12"
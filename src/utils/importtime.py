@@ -0,0 +1,90 @@
+# Standard Library
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+from statistics import median
+from typing import NamedTuple
+
+
+class ImportTime(NamedTuple):
+    module: str
+    own: int
+    cumulative: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    """Parse ``python -X importtime`` output, times are in microseconds."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        if not own.strip().isdigit():
+            continue
+        stripped = name.lstrip()
+        imports.append(ImportTime(stripped.rstrip(), int(own), int(cumulative), (len(name) - len(stripped) - 1) // 2))
+
+    return imports
+
+
+def measure_imports(module: str, runs: int = 5, cwd: Path | None = None) -> list[ImportTime]:
+    """Import ``module`` in ``runs`` fresh interpreters, taking the median time of each module."""
+    samples: dict[str, list[ImportTime]] = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd or Path(__file__).parent.parent,
+        )
+        for imported in parse_importtime(result.stderr):
+            samples.setdefault(imported.module, []).append(imported)
+
+    return [
+        ImportTime(name, int(median(i.own for i in times)), int(median(i.cumulative for i in times)), times[0].depth)
+        for name, times in samples.items()
+    ]
+
+
+def total_time(imports: list[ImportTime]) -> int:
+    return sum(imported.cumulative for imported in imports if imported.depth == 0)
+
+
+def by_package(imports: list[ImportTime]) -> list[tuple[str, int]]:
+    """Own import time summed per top level package, most expensive first."""
+    totals: Counter[str] = Counter()
+    for imported in imports:
+        totals[imported.module.split(".")[0]] += imported.own
+
+    return totals.most_common()
+
+
+# --- tests
+
+EXAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:        50 |        150 | io
+import time:       300 |        300 |     rich.style
+import time:       200 |        500 |   rich.console
+import time:        20 |        520 | rich
+"""
+
+
+def test_parse_importtime() -> None:
+    imports = parse_importtime(EXAMPLE)
+    assert imports[0] == ImportTime("_io", 100, 100, 1)
+    assert imports[2] == ImportTime("rich.style", 300, 300, 2)
+    assert total_time(imports) == 670
+
+
+def test_by_package() -> None:
+    assert by_package(parse_importtime(EXAMPLE)) == [("rich", 520), ("_io", 100), ("io", 50)]
+
+
+def test_measure_imports() -> None:
+    imports = measure_imports("utils.importtime", runs=1)
+    assert any(imported.module == "utils.importtime" for imported in imports)
@@ -0,0 +1,138 @@
+# Standard Library
+import os
+from collections import Counter, defaultdict
+from collections.abc import Generator, Mapping, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import Any
+
+_NULL_CONTEXT = nullcontext()
+
+
+@dataclass
+class Recorder:
+    counters: Counter[str] = field(default_factory=Counter)
+    histograms: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    timers: dict[str, list[int]] = field(default_factory=lambda: defaultdict(list))
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def observe(self, name: str, value: float) -> None:
+        self.histograms[name].append(value)
+
+    @contextmanager
+    def timer(self, name: str) -> Generator[None, None, None]:
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.timers[name].append(perf_counter_ns() - start)
+
+
+@dataclass(frozen=True)
+class Summary:
+    kind: str
+    name: str
+    count: int
+    total: float
+    minimum: float | None = None
+    median: float | None = None
+    maximum: float | None = None
+
+
+_recorder = Recorder()
+
+
+def _count(name: str, n: int = 1) -> None:
+    pass
+
+
+def _observe(name: str, value: float) -> None:
+    pass
+
+
+def _timer(name: str) -> AbstractContextManager[Any]:
+    return _NULL_CONTEXT
+
+
+count = _count
+observe = _observe
+timer = _timer
+
+
+def enabled() -> bool:
+    return count is not _count
+
+
+def enable() -> None:
+    """Swap the no-op ``count``, ``observe`` and ``timer`` for recording versions.
+
+    Solutions must call them through the module, e.g. ``instrument.count("heap.push")``, for this
+    to take effect. Also enabled at import when ``AOC_INSTRUMENT`` is set.
+    """
+    global count, observe, timer
+    count, observe, timer = _recorder.count, _recorder.observe, _recorder.timer
+
+
+def disable() -> None:
+    global count, observe, timer
+    count, observe, timer = _count, _observe, _timer
+
+
+def reset() -> None:
+    _recorder.counters.clear()
+    _recorder.histograms.clear()
+    _recorder.timers.clear()
+
+
+def summary() -> list[Summary]:
+    # Standard Library
+    from statistics import median
+
+    summaries = [Summary("counter", name, value, value) for name, value in sorted(_recorder.counters.items())]
+    sources: dict[str, Mapping[str, Sequence[float]]] = {"histogram": _recorder.histograms, "timer": _recorder.timers}
+    for kind, values in sources.items():
+        summaries.extend(
+            Summary(kind, name, len(v), sum(v), min(v), median(v), max(v)) for name, v in sorted(values.items()) if v
+        )
+
+    return summaries
+
+
+if os.environ.get("AOC_INSTRUMENT"):
+    enable()
+
+
+# --- tests
+
+
+def test_disabled() -> None:
+    disable()
+    reset()
+    count("test")
+    observe("test", 1)
+    with timer("test"):
+        pass
+    assert not enabled()
+    assert summary() == []
+
+
+def test_enabled() -> None:
+    enable()
+    reset()
+    try:
+        count("pushes")
+        count("pushes", 2)
+        for value in (1, 2, 9):
+            observe("depth", value)
+        with timer("loop"):
+            pass
+    finally:
+        disable()
+
+    pushes, depth, loop = summary()
+    assert pushes == Summary("counter", "pushes", 3, 3)
+    assert depth == Summary("histogram", "depth", 3, 12, 1, 2, 9)
+    assert (loop.kind, loop.count) == ("timer", 1)
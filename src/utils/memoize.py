@@ -0,0 +1,252 @@
+# Standard Library
+import os
+from collections.abc import Callable, Mapping
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    # Standard Library
+    import sqlite3
+
+# sqlite3, pickle and hashlib are imported where the disk store needs them, so a plain in-memory
+# ``memo`` costs nothing extra to import
+
+T = TypeVar("T")
+
+_KWARGS = object()
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    disk_hits: int = 0
+    disk_entries: int = 0
+
+
+def stable_repr(obj: Any) -> str:
+    """A ``repr`` that is the same across runs, for sets and mappings too, to digest arguments with."""
+    match obj:
+        case tuple() | list():
+            return f"{type(obj).__name__}({','.join(map(stable_repr, obj))})"
+        case set() | frozenset():
+            return f"{type(obj).__name__}({','.join(sorted(map(stable_repr, obj)))})"
+        case Mapping():
+            items = sorted(f"{stable_repr(key)}:{stable_repr(value)}" for key, value in obj.items())
+            return f"{type(obj).__name__}({','.join(items)})"
+        case _:
+            return repr(obj)
+
+
+def digest(obj: Any) -> str:
+    # Standard Library
+    import hashlib
+
+    return hashlib.blake2b(stable_repr(obj).encode(), digest_size=16).hexdigest()
+
+
+class MemoStore:
+    """SQLite table of pickled results keyed by function, its module's source and argument digest.
+
+    Writes are buffered and flushed in batches, and at exit. After a flush only the newest
+    ``max_rows`` rows are kept.
+    """
+
+    def __init__(self, path: Path, max_rows: int = 1_000_000, batch: int = 10_000) -> None:
+        # Standard Library
+        import atexit
+
+        self.path = path
+        self.max_rows = max_rows
+        self.batch = batch
+        self._db: sqlite3.Connection | None = None
+        self._pending: list[tuple[str, str, str, bytes]] = []
+        atexit.register(self.flush)
+
+    @property
+    def db(self) -> "sqlite3.Connection":
+        # Standard Library
+        import sqlite3
+
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=30)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS memo ("
+                "function TEXT, source TEXT, key TEXT, value BLOB, PRIMARY KEY (function, source, key))"
+            )
+        return self._db
+
+    def load(self, function: str, source: str) -> dict[str, bytes]:
+        self.flush()
+        rows = self.db.execute("SELECT key, value FROM memo WHERE function = ? AND source = ?", (function, source))
+        return dict(rows.fetchall())
+
+    def add(self, function: str, source: str, key: str, value: bytes) -> None:
+        self._pending.append((function, source, key, value))
+        if len(self._pending) >= self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+
+        with self.db as db:
+            db.executemany("INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?)", self._pending)
+            db.execute(
+                "DELETE FROM memo WHERE rowid IN (SELECT rowid FROM memo ORDER BY rowid LIMIT "
+                "max(0, (SELECT count(*) FROM memo) - ?))",
+                (self.max_rows,),
+            )
+        self._pending.clear()
+
+
+MEMO_STORE = MemoStore(Path(path) / "memo.sqlite") if (path := os.environ.get("AOC_MEMO_DIR")) else None
+
+
+def source_hash(func: Callable[..., Any]) -> str:
+    # Standard Library
+    import hashlib
+
+    return hashlib.blake2b(Path(func.__code__.co_filename).read_bytes(), digest_size=16).hexdigest()
+
+
+def memo(func: Callable[..., T] | None = None, *, maxsize: int | None = None, store: MemoStore | None = None) -> Any:
+    """``functools.lru_cache``, unbounded by default, that can also keep results on disk.
+
+    With a ``store``, or ``AOC_MEMO_DIR`` set, results are also saved to SQLite keyed by a
+    stable digest of the arguments, and the next run starts warm from them. Editing anything in
+    the function's module invalidates its saved results. Results must be picklable and the
+    arguments must have a stable ``repr``, so not for closures over per-input state.
+    ``cache_info`` adds disk hits and entries to the usual fields, and ``cache_clear`` only
+    empties the in-process cache. Without a store this is plain ``lru_cache``, which runs at C
+    speed, the disk path costs a Python call per lookup.
+    """
+    if func is None:
+        return lambda func: memo(func, maxsize=maxsize, store=store)
+
+    store = store or MEMO_STORE
+    if store is None:
+        return lru_cache(maxsize)(func)
+
+    # Standard Library
+    import pickle
+
+    # First Party
+    from utils.collections import CachingDict
+
+    name, source = f"{func.__module__}.{func.__qualname__}", source_hash(func)
+    saved: dict[str, bytes] | None = None
+    stats = {"calls": 0, "disk_hits": 0}
+
+    def compute(key: tuple[Any, ...]) -> T:
+        nonlocal saved
+        args, kwargs = key, {}
+        if _KWARGS in key:
+            split = key.index(_KWARGS)
+            args, kwargs = key[:split], dict(key[split + 1 :])
+
+        if saved is None:
+            saved = store.load(name, source)
+        if (data := saved.get(key_digest := digest((args, kwargs)))) is not None:
+            stats["disk_hits"] += 1
+            return pickle.loads(data)
+
+        value = func(*args, **kwargs)
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        saved[key_digest] = data
+        store.add(name, source, key_digest, data)
+        return value
+
+    results = CachingDict[tuple[Any, ...], T](compute, maxsize=maxsize)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        stats["calls"] += 1
+        return results[(*args, _KWARGS, *kwargs.items()) if kwargs else args]
+
+    def cache_info() -> MemoInfo:
+        info = results.cache_info()
+        return MemoInfo(
+            stats["calls"] - info.misses, info.misses, maxsize, info.currsize, stats["disk_hits"], len(saved or ())
+        )
+
+    def cache_clear() -> None:
+        nonlocal saved
+        results.cache_clear()
+        saved = None
+        stats["calls"] = stats["disk_hits"] = 0
+
+    wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+# --- tests
+
+
+def test_stable_repr() -> None:
+    assert stable_repr({"b": {2, 1}, "a": (1, [2])}) == "dict('a':tuple(1,list(2)),'b':set(1,2))"
+    assert digest(frozenset("abc")) == digest(frozenset("cba"))
+
+
+def test_memo_import_is_cheap() -> None:
+    # First Party
+    from utils.importtime import measure_imports
+
+    imported = {i.module for i in measure_imports("utils.memoize", runs=1)}
+    assert not imported & {"atexit", "hashlib", "pickle", "sqlite3", "utils.collections"}
+
+
+def test_memo() -> None:
+    calls: list[int] = []
+
+    @memo
+    def fib(n: int) -> int:
+        calls.append(n)
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert fib(30) == 832040
+    assert len(calls) == 31
+    assert fib.cache_info()[:4] == (28, 31, None, 31)  # type: ignore[attr-defined]
+
+    fib.cache_clear()  # type: ignore[attr-defined]
+    assert fib.cache_info().currsize == 0  # type: ignore[attr-defined]
+
+
+def test_memo_maxsize() -> None:
+    @memo(maxsize=2)
+    def square(n: int) -> int:
+        return n * n
+
+    for n in (1, 2, 3, 1):
+        square(n)
+    assert square.cache_info()[:4] == (0, 4, 2, 2)
+
+
+def test_memo_store(tmp_path: Path) -> None:
+    calls: list[int] = []
+
+    def fib(n: int) -> int:
+        calls.append(n)
+        return n if n < 2 else cached(n - 1) + cached(n - 2)
+
+    store = MemoStore(tmp_path / "memo.sqlite", max_rows=20)
+    cached = memo(fib, store=store)
+    assert cached(30) == 832040
+    store.flush()
+
+    calls.clear()
+    cached = memo(fib, store=MemoStore(tmp_path / "memo.sqlite"))
+    assert cached(30) == 832040
+    assert calls == []
+    assert cached.cache_info().disk_hits == 1
+
+    # Only fib(11) to fib(30) were kept
+    assert cached(11) == 89
+    assert calls == []
+    assert cached(10) == 55
+    assert calls == list(range(10, -1, -1))
+    assert cached.cache_info().disk_entries == 31
@@ -0,0 +1,173 @@
+# Standard Library
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+Allocation = tuple[str, int, int]
+
+IGNORED = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+]
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    peak: int = 0
+    retained: int = 0
+    blocks: int = 0
+    top: list[Allocation] = field(default_factory=list)
+    snapshot: tracemalloc.Snapshot | None = field(default=None, repr=False, compare=False)
+    error: str | None = None
+    at_peak: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def sampled(self) -> str:
+        """When ``blocks``, ``top`` and ``snapshot`` were taken, for labelling them."""
+        return "at peak" if self.at_peak else "post-call"
+
+
+class PeakSampler(threading.Thread):
+    """Snapshot the traced allocations whenever the traced memory reaches a new high.
+
+    ``tracemalloc`` only tracks the peak size, not what was allocated at the time, so this polls
+    from a background thread and re-snapshots once usage grows past the last snapshot by ``growth``.
+    """
+
+    def __init__(self, interval: float = 0.005, growth: float = 1.1) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.size = 0
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._stop_event = threading.Event()
+
+    def sample(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.size * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, limit: int = 10) -> list[Allocation]:
+    stats = snapshot.filter_traces(IGNORED).statistics("lineno")
+    return [
+        (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size, stat.count) for stat in stats[:limit]
+    ]
+
+
+def compare_snapshots(old: tracemalloc.Snapshot, new: tracemalloc.Snapshot, limit: int = 10) -> list[Allocation]:
+    """The source lines whose allocations changed the most between two snapshots, as size and count deltas."""
+    stats = new.filter_traces(IGNORED).compare_to(old.filter_traces(IGNORED), "lineno")
+    return [
+        (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size_diff, stat.count_diff)
+        for stat in stats[:limit]
+    ]
+
+
+def measure_memory(func: Callable[..., Any], *args: Any, top: int = 10, interval: float = 0.005) -> MemoryReport:
+    """Run ``func(*args)`` under ``tracemalloc``, reporting peak and retained memory.
+
+    The top allocating lines, and the block count, come from a snapshot taken close to the peak.
+    When no sample landed within ``growth`` of the peak, as for a call shorter than ``interval``,
+    it falls back to a snapshot taken after the call returns and ``at_peak`` is ``False``.
+    """
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+    sampler = PeakSampler(interval)
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        sampler.start()
+        try:
+            func(*args)
+        finally:
+            sampler.stop()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = sampler.snapshot
+        at_peak = snapshot is not None and peak <= sampler.size * sampler.growth
+        if snapshot is None or not at_peak:
+            snapshot = tracemalloc.take_snapshot()
+    except Exception as e:
+        return MemoryReport(error=f"{type(e).__name__}: {e}")
+    finally:
+        tracemalloc.stop()
+
+    return MemoryReport(
+        peak=peak - start,
+        retained=current - start,
+        blocks=sum(stat.count for stat in snapshot.filter_traces(IGNORED).statistics("filename")),
+        top=top_allocations(snapshot, top),
+        snapshot=snapshot,
+        at_peak=at_peak,
+    )
+
+
+def format_bytes(size: float) -> str:
+    for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if abs(size) >= scale:
+            return f"{size / scale:.1f}{unit}"
+    return f"{size:.0f}B"
+
+
+# --- tests
+
+
+def _allocate(size: int) -> int:
+    blocks = [bytearray(1024) for _ in range(size)]
+    time.sleep(0.05)
+    return len(blocks)
+
+
+def test_measure_memory() -> None:
+    report = measure_memory(_allocate, 1000)
+    assert report.ok
+    assert report.peak >= 1000 * 1024
+    assert report.retained < report.peak
+    assert any(__file__ in location for location, _, _ in report.top)
+    assert report.at_peak
+
+
+def test_measure_memory_short_part() -> None:
+    report = measure_memory(sum, range(10), interval=1)
+    assert report.ok
+    assert not report.at_peak
+    assert report.sampled == "post-call"
+
+
+def test_measure_memory_error() -> None:
+    report = measure_memory(_allocate, "nope")
+    assert not report.ok
+
+
+def test_compare_snapshots() -> None:
+    small = measure_memory(_allocate, 100)
+    big = measure_memory(_allocate, 1000)
+    assert small.snapshot is not None
+    assert big.snapshot is not None
+
+    location, size_diff, _ = compare_snapshots(small.snapshot, big.snapshot)[0]
+    assert __file__ in location
+    assert size_diff > 0
+
+
+def test_format_bytes() -> None:
+    assert format_bytes(512) == "512B"
+    assert format_bytes(1536) == "1.5KiB"
+    assert format_bytes(3 << 20) == "3.0MiB"
@@ -0,0 +1,85 @@
+# Standard Library
+import re
+from array import array
+
+# First Party
+from utils.exceptions import RowWidthError
+
+Data = str | bytes | bytearray | memoryview
+
+INTEGER = re.compile(rb"-?\d+")
+UNSIGNED_INTEGER = re.compile(rb"\d+")
+
+_NUMBER_BYTES = b"0123456789-"
+# Every byte that can't be part of a number becomes a space, newlines are kept for ``int_rows``
+_SIGNED = bytes(byte if byte in _NUMBER_BYTES or byte == ord("\n") else ord(" ") for byte in range(256))
+_UNSIGNED = _SIGNED.replace(b"-", b" ")
+
+
+def _as_bytes(data: Data) -> bytes:
+    if isinstance(data, str):
+        return data.encode()
+    return data if isinstance(data, bytes) else bytes(data)
+
+
+def _to_array(data: bytes, signed: bool) -> array:
+    try:
+        return array("q", map(int, data.split()))
+    except ValueError:
+        # A ``-`` that isn't a sign, like ``a-b`` or ``1-2``, take the slow road
+        return array("q", map(int, (INTEGER if signed else UNSIGNED_INTEGER).findall(data)))
+
+
+def ints(data: Data, signed: bool = True) -> array:
+    """Every integer in ``data``, in order, as an ``array('q')``.
+
+    Anything that isn't a digit or a sign is a separator, so ``"p=0,4 v=3,-3"`` gives
+    ``[0, 4, 3, -3]``. With ``signed=False`` a ``-`` is a separator too, for ranges like
+    ``"10-20"``. Values must fit in a signed 64 bit int.
+    """
+    return _to_array(_as_bytes(data).translate(_SIGNED if signed else _UNSIGNED), signed)
+
+
+def int_rows(data: Data, width: int | None = None, signed: bool = True) -> list[array]:
+    """The integers in ``data`` grouped one row per line, or into rows of ``width`` regardless of lines.
+
+    Lines without any integers give empty rows. With ``width`` the count must divide evenly, or
+    ``RowWidthError`` is raised.
+    """
+    if width is None:
+        table = _SIGNED if signed else _UNSIGNED
+        return [_to_array(line, signed) for line in _as_bytes(data).translate(table).split(b"\n")]
+
+    values = ints(data, signed)
+    if len(values) % width:
+        raise RowWidthError(len(values), width)
+    return [values[start : start + width] for start in range(0, len(values), width)]
+
+
+# --- tests
+
+
+def test_ints() -> None:
+    assert ints("p=0,4 v=3,-3") == array("q", [0, 4, 3, -3])
+    assert ints(b"Button A: X+94, Y+34") == array("q", [94, 34])
+    assert ints(memoryview(b"3   4\n4   3")) == array("q", [3, 4, 4, 3])
+    assert ints("a-b 1-2 --3") == array("q", [1, -2, -3])
+    assert ints("10-20", signed=False) == array("q", [10, 20])
+    assert ints("") == array("q")
+
+
+def test_int_rows() -> None:
+    assert int_rows("190: 10 19\n\n3267: 81 40 27") == [
+        array("q", [190, 10, 19]),
+        array("q"),
+        array("q", [3267, 81, 40, 27]),
+    ]
+    assert int_rows("1,2,3\n4,5,6", width=2) == [array("q", [1, 2]), array("q", [3, 4]), array("q", [5, 6])]
+
+
+def test_int_rows_width_mismatch() -> None:
+    # Third Party
+    import pytest
+
+    with pytest.raises(RowWidthError):
+        int_rows("1 2 3 4 5", width=2)
@@ -0,0 +1,207 @@
+# Standard Library
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import cache, wraps
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+Key = tuple[str, str, str]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@cache
+def source_digest(parser: Callable[..., Any]) -> bytes:
+    """Digest of the module ``parser`` is defined in, empty for builtins which have no source."""
+    if (code := getattr(parser, "__code__", None)) is None:
+        return b""
+    return hashlib.blake2b(Path(code.co_filename).read_bytes(), digest_size=16).digest()
+
+
+class ParseCache:
+    """Cache of parsed puzzle inputs keyed by (day, input and source hash, parser).
+
+    Results are stored pickled, so every hit hands back a fresh copy that the caller is free to
+    mutate. Entries live in an in-process LRU and, when ``directory`` is set, on disk as well.
+    Editing anything in the parser's module invalidates its entries.
+    """
+
+    def __init__(self, maxsize: int = 32, directory: Path | None = None) -> None:
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Key, bytes] = OrderedDict()
+
+    @staticmethod
+    def key(parser: Callable[..., Any], puzzle: str, *args: Any) -> Key:
+        digest = hashlib.blake2b(puzzle.encode(), digest_size=16)
+        digest.update(source_digest(parser))
+        if args:
+            digest.update(repr(args).encode())
+        return getattr(parser, "__module__", None) or "", digest.hexdigest(), parser.__qualname__
+
+    def _path(self, key: Key) -> Path | None:
+        if self.directory is None:
+            return None
+        day, digest, name = key
+        return self.directory / f"{day}-{name}-{digest}.pickle"
+
+    def _load(self, key: Key) -> bytes | None:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        if (path := self._path(key)) is not None and path.exists():
+            return path.read_bytes()
+
+        return None
+
+    def _remember(self, key: Key, data: bytes) -> None:
+        self._entries[key] = data
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _store(self, key: Key, data: bytes) -> None:
+        self._remember(key, data)
+        if (path := self._path(key)) is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+
+    def get(self, parser: Callable[..., T], puzzle: str, *args: Any) -> T:
+        key = self.key(parser, puzzle, *args)
+        if (data := self._load(key)) is not None:
+            self.hits += 1
+            self._remember(key, data)
+        else:
+            self.misses += 1
+            data = pickle.dumps(parser(puzzle, *args), protocol=pickle.HIGHEST_PROTOCOL)
+            self._store(key, data)
+
+        return pickle.loads(data)
+
+    def keys(self) -> list[Key]:
+        return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop the in-process entries, anything on disk is kept."""
+        self._entries.clear()
+
+    def discard(self, parser: Callable[..., Any]) -> None:
+        """Drop every entry for ``parser``, in-process and on disk, whatever the input or source."""
+        day, name = getattr(parser, "__module__", None) or "", parser.__qualname__
+        for key in [key for key in self._entries if key[0] == day and key[2] == name]:
+            del self._entries[key]
+
+        if self.directory is not None:
+            for path in self.directory.glob(f"{day}-{name}-*.pickle"):
+                path.unlink(missing_ok=True)
+
+
+PARSE_CACHE = ParseCache(directory=Path(path) if (path := os.environ.get("AOC_PARSE_CACHE_DIR")) else None)
+
+
+def cached_parser(parser: Callable[..., T]) -> Callable[..., T]:
+    """Parse each distinct input once, later calls get a copy of the cached result.
+
+    Only for parsers returning picklable data, not generators.
+    """
+    stats = {"hits": 0, "misses": 0}
+
+    @wraps(parser)
+    def wrapper(puzzle: str, *args: Any) -> T:
+        hits = PARSE_CACHE.hits
+        result = PARSE_CACHE.get(parser, puzzle, *args)
+        stats["hits" if PARSE_CACHE.hits > hits else "misses"] += 1
+        return result
+
+    def cache_info() -> CacheInfo:
+        entries = sum(1 for key in PARSE_CACHE.keys() if key[0] == parser.__module__ and key[2] == parser.__qualname__)
+        return CacheInfo(stats["hits"], stats["misses"], PARSE_CACHE.maxsize, entries)
+
+    def cache_clear() -> None:
+        PARSE_CACHE.discard(parser)
+        stats.update(hits=0, misses=0)
+
+    wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+# --- tests
+
+
+def test_parse_cache() -> None:
+    calls: list[str] = []
+
+    def parser(puzzle: str) -> list[int]:
+        calls.append(puzzle)
+        return [int(x) for x in puzzle.split()]
+
+    cache = ParseCache()
+    first = cache.get(parser, "1 2 3")
+    first.append(4)
+
+    assert cache.get(parser, "1 2 3") == [1, 2, 3]
+    assert cache.get(parser, "4 5") == [4, 5]
+    assert calls == ["1 2 3", "4 5"]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_parse_cache_eviction() -> None:
+    cache = ParseCache(maxsize=1)
+    cache.get(str.split, "a b")
+    cache.get(str.split, "c d")
+    cache.get(str.split, "a b")
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_parse_cache_on_disk(tmp_path: Path) -> None:
+    ParseCache(directory=tmp_path).get(str.split, "a b")
+
+    cache = ParseCache(directory=tmp_path)
+    assert cache.get(str.split, "a b") == ["a", "b"]
+    assert cache.hits == 1
+
+
+def test_parse_cache_key_includes_source() -> None:
+    def parser(puzzle: str) -> str:
+        return puzzle
+
+    # Same input, but only the parser with source mixes it into the digest
+    assert ParseCache.key(parser, "a")[1] != ParseCache.key(str.split, "a")[1]
+    assert source_digest(str.split) == b""
+    assert source_digest(parser) == hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+
+def test_parse_cache_discard(tmp_path: Path) -> None:
+    cache = ParseCache(directory=tmp_path)
+    cache.get(str.split, "a b")
+    cache.get(str.strip, "a b")
+
+    cache.discard(str.split)
+    assert [key[2] for key in cache.keys()] == ["str.strip"]
+    assert [path.name.split("-")[1] for path in tmp_path.iterdir()] == ["str.strip"]
+
+
+def test_cached_parser() -> None:
+    @cached_parser
+    def parser(puzzle: str) -> dict[str, int]:
+        return {puzzle: len(puzzle)}
+
+    parser("abc")["abc"] = 0
+    assert parser("abc") == {"abc": 3}
+    assert parser.cache_info().hits >= 1  # type: ignore[attr-defined]
+
+    parser.cache_clear()  # type: ignore[attr-defined]
+    assert parser.cache_info().currsize == 0  # type: ignore[attr-defined]
@@ -0,0 +1,81 @@
+# Standard Library
+from collections import defaultdict
+from collections.abc import Generator
+from contextlib import ContextDecorator, contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import Self
+
+
+@dataclass
+class Recorder:
+    phases: dict[str, int] | None = None
+    stack: list[str] = field(default_factory=list)
+    last: int = 0
+
+
+_recorder = Recorder()
+
+
+class Phase(ContextDecorator):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> Self:
+        if (phases := _recorder.phases) is not None:
+            now = perf_counter_ns()
+            if _recorder.stack:
+                phases[_recorder.stack[-1]] += now - _recorder.last
+            _recorder.stack.append(self.name)
+            _recorder.last = now
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if (phases := _recorder.phases) is not None and _recorder.stack:
+            now = perf_counter_ns()
+            phases[_recorder.stack.pop()] += now - _recorder.last
+            _recorder.last = now
+
+
+def phase(name: str) -> Phase:
+    """Label a region of a solution, e.g. ``with phase("parse"):`` or ``@phase("parse")``.
+
+    Does nothing beyond a global check unless the harness is recording. Times are exclusive, a
+    nested phase pauses the one around it, and anything outside a phase is left unlabelled.
+    """
+    return Phase(name)
+
+
+@contextmanager
+def record_phases() -> Generator[dict[str, int], None, None]:
+    """Enable phase recording, yielding the nanoseconds spent in each phase."""
+    phases: dict[str, int] = defaultdict(int)
+    _recorder.phases = phases
+    _recorder.stack.clear()
+    try:
+        yield phases
+    finally:
+        _recorder.phases = None
+        _recorder.stack.clear()
+
+
+# --- tests
+
+
+def test_phase_disabled() -> None:
+    with phase("parse"):
+        pass
+    assert _recorder.phases is None
+
+
+def test_record_phases() -> None:
+    @phase("parse")
+    def parse() -> list[int]:
+        return list(range(1000))
+
+    with record_phases() as phases:
+        with phase("solve"):
+            sum(parse())
+
+    assert set(phases) == {"parse", "solve"}
+    assert all(phases.values())
@@ -0,0 +1,188 @@
+# Standard Library
+import json
+import signal
+import sys
+from collections import Counter
+from pathlib import Path
+from time import perf_counter_ns, process_time
+from types import CodeType, FrameType
+from typing import Any, Self
+
+Frame = tuple[str, str, int]
+Stacks = Counter[tuple[Frame, ...]]
+
+
+def code_frame(code: CodeType) -> Frame:
+    return code.co_qualname, code.co_filename, code.co_firstlineno
+
+
+def frame_stack(frame: FrameType | None, stop: FrameType | None = None) -> tuple[Frame, ...]:
+    stack: list[Frame] = []
+    while frame is not None and frame is not stop:
+        stack.append(code_frame(frame.f_code))
+        frame = frame.f_back
+
+    return tuple(reversed(stack))
+
+
+class StackSampler:
+    """Low overhead statistical profiler.
+
+    A ``SIGPROF`` interval timer interrupts the main thread ``hz`` times per second of CPU time
+    and the current Python stack is recorded. Each sample is weighted by the interval in
+    nanoseconds, so totals approximate CPU time. Only usable from the main thread.
+    """
+
+    def __init__(self, hz: int = 1000) -> None:
+        self.interval = 1 / hz
+        self.stacks: Stacks = Counter()
+        self._base: FrameType | None = None
+        self._previous: Any = None
+
+    def _handler(self, signum: int, frame: FrameType | None) -> None:
+        self.stacks[frame_stack(frame, self._base)] += int(self.interval * 1e9)
+
+    def __enter__(self) -> Self:
+        self._base = sys._getframe(1)
+        self._previous = signal.signal(signal.SIGPROF, self._handler)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+
+class StackTracer:
+    """Deterministic profiler recording the exact self time of every distinct call stack.
+
+    Uses ``sys.setprofile`` so every Python and C call is seen, at a much higher overhead
+    than ``StackSampler``.
+    """
+
+    def __init__(self) -> None:
+        self.stacks: Stacks = Counter()
+        self._stack: list[Frame] = []
+        self._last = 0
+
+    def _profile(self, frame: FrameType, event: str, arg: Any) -> None:
+        now = perf_counter_ns()
+        if self._stack:
+            self.stacks[tuple(self._stack)] += now - self._last
+
+        match event:
+            case "call":
+                self._stack.append(code_frame(frame.f_code))
+            case "c_call":
+                self._stack.append((getattr(arg, "__qualname__", repr(arg)), "~", 0))
+            case "return" | "c_return" | "c_exception" if self._stack:
+                self._stack.pop()
+
+        self._last = perf_counter_ns()
+
+    def __enter__(self) -> Self:
+        self._last = perf_counter_ns()
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        sys.setprofile(None)
+
+
+def frame_name(frame: Frame) -> str:
+    name, filename, _ = frame
+    return name if filename == "~" else f"{Path(filename).name}:{name}"
+
+
+def to_collapsed(stacks: Stacks) -> str:
+    """Brendan Gregg's collapsed stack format, as read by ``flamegraph.pl`` and friends."""
+    return "\n".join(
+        f"{';'.join(frame_name(frame) for frame in stack)} {weight}" for stack, weight in stacks.items() if stack
+    )
+
+
+def to_speedscope(stacks: Stacks, name: str) -> dict[str, Any]:
+    frames: dict[Frame, int] = {}
+    samples: list[list[int]] = []
+    weights: list[int] = []
+    for stack, weight in stacks.items():
+        if not stack:
+            continue
+        samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+        weights.append(weight)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": n, "file": f, "line": line} for n, f, line in frames]},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "nanoseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+        "name": name,
+        "exporter": "advent-of-code",
+    }
+
+
+def function_totals(stacks: Stacks) -> list[tuple[Frame, int, int]]:
+    """Self and inclusive weight per function, heaviest self weight first."""
+    own: Counter[Frame] = Counter()
+    total: Counter[Frame] = Counter()
+    for stack, weight in stacks.items():
+        if not stack:
+            continue
+        own[stack[-1]] += weight
+        for frame in set(stack):
+            total[frame] += weight
+
+    return sorted(((frame, own[frame], total[frame]) for frame in total), key=lambda row: (-row[1], -row[2]))
+
+
+# --- tests
+
+
+def _fib(n: int) -> int:
+    return n if n < 2 else _fib(n - 1) + _fib(n - 2)
+
+
+def test_stack_tracer() -> None:
+    with StackTracer() as tracer:
+        _fib(5)
+
+    fib_stacks = [stack for stack in tracer.stacks if stack and stack[0][0] == "_fib"]
+    assert max(map(len, fib_stacks)) == 5
+    assert "test_stack_tracer" not in to_collapsed(tracer.stacks)
+
+
+def test_stack_sampler() -> None:
+    deadline = process_time() + 0.05
+    with StackSampler(hz=1000) as sampler:
+        while process_time() < deadline:
+            _fib(15)
+
+    ((frame, own, total), *_) = function_totals(sampler.stacks)
+    assert frame[0] == "_fib"
+    assert own and total >= own
+
+
+def test_to_collapsed() -> None:
+    stacks: Stacks = Counter({(("a", "x.py", 1), ("b", "x.py", 5)): 10, (("len", "~", 0),): 2})
+    assert to_collapsed(stacks) == "x.py:a;x.py:b 10\nlen 2"
+
+
+def test_to_speedscope() -> None:
+    stacks: Stacks = Counter({(("a", "x.py", 1), ("b", "x.py", 5)): 10, (("a", "x.py", 1),): 3})
+    profile = to_speedscope(stacks, "test")
+    assert profile["shared"]["frames"] == [
+        {"name": "a", "file": "x.py", "line": 1},
+        {"name": "b", "file": "x.py", "line": 5},
+    ]
+    assert profile["profiles"][0]["samples"] == [[0, 1], [0]]
+    assert profile["profiles"][0]["endValue"] == 13
+    json.dumps(profile)
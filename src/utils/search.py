@@ -0,0 +1,280 @@
+# Standard Library
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+
+# First Party
+from utils import instrument
+
+INF = 1 << 62
+NO_PARENT = -1
+
+Neighbours = Callable[[int], Iterable[int]]
+WeightedNeighbours = Callable[[int], Iterable[tuple[int, int]]]
+
+
+class _Sparse(dict[int, int]):
+    def __init__(self, default: int) -> None:
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, key: int) -> int:
+        return self.default
+
+
+def _table(size: int | None, default: int) -> list[int] | _Sparse:
+    """A flat list when the states are known to be ``range(size)``, otherwise a dict."""
+    return [default] * size if size is not None else _Sparse(default)
+
+
+@dataclass
+class SearchResult:
+    distances: list[int] | dict[int, int]
+    parents: list[int] | dict[int, int]
+    predecessors: dict[int, list[int]] = field(default_factory=dict)
+    goal: int | None = None
+    expanded: int = 0
+
+    def distance(self, state: int) -> int:
+        return self.distances[state]
+
+    def reached(self, state: int) -> bool:
+        return self.distances[state] != INF
+
+    def path(self, state: int | None = None) -> list[int]:
+        """States from a start to ``state``, or to the goal found, following parent pointers."""
+        state = self.goal if state is None else state
+        if state is None or not self.reached(state):
+            return []
+
+        path = [state]
+        while (state := self.parents[state]) != NO_PARENT:
+            path.append(state)
+
+        return path[::-1]
+
+    def on_shortest_paths(self, ends: Iterable[int]) -> set[int]:
+        """Every state on any shortest path to ``ends``, needs ``all_paths=True``."""
+        seen = set(ends)
+        todo = list(seen)
+        while todo:
+            for previous in self.predecessors.get(todo.pop(), ()):
+                if previous not in seen:
+                    seen.add(previous)
+                    todo.append(previous)
+
+        return seen
+
+
+def _start(starts: Iterable[int], size: int | None, all_paths: bool) -> tuple[SearchResult, list[int]]:
+    result = SearchResult(_table(size, INF), _table(size, NO_PARENT))
+    initial = []
+    for start in starts:
+        result.distances[start] = 0
+        initial.append(start)
+        if all_paths:
+            result.predecessors[start] = []
+
+    return result, initial
+
+
+def _relax(result: SearchResult, state: int, next_state: int, distance: int, all_paths: bool) -> bool:
+    """Record reaching ``next_state`` at ``distance`` from ``state``, True if it is an improvement."""
+    best = result.distances[next_state]
+    if distance < best:
+        result.distances[next_state] = distance
+        result.parents[next_state] = state
+        if all_paths:
+            result.predecessors[next_state] = [state]
+        return True
+
+    if all_paths and distance == best:
+        result.predecessors[next_state].append(state)
+
+    return False
+
+
+def bfs(  # noqa: PLR0913
+    starts: Iterable[int],
+    neighbours: Neighbours,
+    is_goal: Callable[[int], bool] | None = None,
+    size: int | None = None,
+    all_paths: bool = False,
+    name: str = "search",
+) -> SearchResult:
+    """Breadth first search where every step costs one.
+
+    States are ints, give ``size`` when they all fall in ``range(size)`` to store distances and
+    parents in flat lists rather than dicts. Stops at the first goal, unless ``all_paths`` is set
+    in which case the rest of the goal's layer is expanded to collect every shortest path.
+    """
+    result, initial = _start(starts, size, all_paths)
+    distances = result.distances
+    frontier = deque(initial)
+    goal_distance = INF
+    counter = f"{name}.expanded"
+    while frontier:
+        state = frontier.popleft()
+        distance = distances[state]
+        if distance > goal_distance:
+            break
+
+        result.expanded += 1
+        instrument.count(counter)
+        if is_goal is not None and is_goal(state):
+            if result.goal is None:
+                result.goal, goal_distance = state, distance
+            if not all_paths:
+                break
+            continue
+
+        for next_state in neighbours(state):
+            if _relax(result, state, next_state, distance + 1, all_paths):
+                frontier.append(next_state)
+
+    return result
+
+
+def dijkstra(  # noqa: PLR0913
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    is_goal: Callable[[int], bool] | None = None,
+    size: int | None = None,
+    all_paths: bool = False,
+    heuristic: Callable[[int], int] | None = None,
+    name: str = "search",
+) -> SearchResult:
+    """Dijkstra's algorithm over ``neighbours(state) -> (next_state, cost)``, or A* with a ``heuristic``.
+
+    The heuristic must be consistent (never overestimate, and never drop by more than a step's
+    cost) for the first goal popped to be optimal. ``size``, ``is_goal`` and ``all_paths`` work
+    as for ``bfs``.
+    """
+    result, initial = _start(starts, size, all_paths)
+    distances = result.distances
+    queue = [(heuristic(start) if heuristic else 0, 0, start) for start in initial]
+    goal_distance = INF
+    counter = f"{name}.expanded"
+    while queue:
+        _, distance, state = heappop(queue)
+        if distance != distances[state]:
+            continue
+        if distance > goal_distance:
+            break
+
+        result.expanded += 1
+        instrument.count(counter)
+        if is_goal is not None and is_goal(state):
+            if result.goal is None:
+                result.goal, goal_distance = state, distance
+            if not all_paths:
+                break
+            continue
+
+        for next_state, cost in neighbours(state):
+            next_distance = distance + cost
+            if _relax(result, state, next_state, next_distance, all_paths):
+                priority = next_distance + (heuristic(next_state) if heuristic else 0)
+                heappush(queue, (priority, next_distance, next_state))
+
+    return result
+
+
+def astar(  # noqa: PLR0913
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    heuristic: Callable[[int], int],
+    is_goal: Callable[[int], bool],
+    size: int | None = None,
+    name: str = "search",
+) -> SearchResult:
+    return dijkstra(starts, neighbours, is_goal, size, heuristic=heuristic, name=name)
+
+
+def zero_one_bfs(  # noqa: PLR0913
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    is_goal: Callable[[int], bool] | None = None,
+    size: int | None = None,
+    all_paths: bool = False,
+    name: str = "search",
+) -> SearchResult:
+    """Shortest paths where every step costs 0 or 1, using a deque instead of a heap."""
+    result, initial = _start(starts, size, all_paths)
+    distances = result.distances
+    frontier = deque((0, state) for state in initial)
+    goal_distance = INF
+    counter = f"{name}.expanded"
+    while frontier:
+        queued, state = frontier.popleft()
+        distance = distances[state]
+        if queued != distance:
+            continue
+        if distance > goal_distance:
+            break
+
+        result.expanded += 1
+        instrument.count(counter)
+        if is_goal is not None and is_goal(state):
+            if result.goal is None:
+                result.goal, goal_distance = state, distance
+            if not all_paths:
+                break
+            continue
+
+        for next_state, cost in neighbours(state):
+            if _relax(result, state, next_state, distance + cost, all_paths):
+                if cost:
+                    frontier.append((distance + cost, next_state))
+                else:
+                    frontier.appendleft((distance, next_state))
+
+    return result
+
+
+# --- tests
+
+#  0 - 1 - 2
+#  |       |
+#  3 - 4 - 5 - 6
+LINKS = {0: [1, 3], 1: [0, 2], 2: [1, 5], 3: [0, 4], 4: [3, 5], 5: [2, 4, 6], 6: [5]}
+
+
+def test_bfs() -> None:
+    result = bfs([0], LINKS.__getitem__, lambda state: state == 6, size=7)
+    assert result.distance(6) == 4
+    assert result.path() in ([0, 1, 2, 5, 6], [0, 3, 4, 5, 6])
+
+    result = bfs([0], LINKS.__getitem__, lambda state: state == 6, all_paths=True)
+    assert result.on_shortest_paths([6]) == set(range(7))
+
+
+def test_dijkstra() -> None:
+    def neighbours(state: int) -> list[tuple[int, int]]:
+        return [(next_state, 10 if {state, next_state} == {0, 3} else 1) for next_state in LINKS[state]]
+
+    result = dijkstra([0], neighbours, lambda state: state == 6)
+    assert result.path() == [0, 1, 2, 5, 6]
+    assert result.distance(6) == 4
+
+    result = dijkstra([0], neighbours, lambda state: state == 6, all_paths=True)
+    assert result.on_shortest_paths([6]) == {0, 1, 2, 5, 6}
+
+    result = astar([0], neighbours, lambda state: 0, lambda state: state == 6)
+    assert result.distance(6) == 4
+
+
+def test_zero_one_bfs() -> None:
+    def neighbours(state: int) -> list[tuple[int, int]]:
+        return [(next_state, 0 if next_state in {3, 4} else 1) for next_state in LINKS[state]]
+
+    result = zero_one_bfs([0], neighbours, lambda state: state == 6, size=7)
+    assert result.distance(6) == 2
+    assert result.path() == [0, 3, 4, 5, 6]
+
+
+def test_unreachable() -> None:
+    result = bfs([0], lambda state: [], lambda state: state == 1)
+    assert result.goal is None
+    assert result.path(1) == []
@@ -0,0 +1,176 @@
+# Standard Library
+import gc
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from statistics import NormalDist, median, quantiles, stdev
+from time import perf_counter_ns
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Timing:
+    samples: list[int] = field(default_factory=list)
+    outliers: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.samples)
+
+    @property
+    def rounds(self) -> int:
+        return len(self.samples) + self.outliers
+
+    @property
+    def minimum(self) -> int:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    @property
+    def stdev(self) -> float:
+        return stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def __str__(self) -> str:
+        if not self.ok:
+            return "TIMEOUT" if self.error and self.error.startswith("TimeLimitError") else "ERROR"
+        return f"{format_ns(self.median)} ± {format_ns(self.stdev)}"
+
+
+def format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f}{unit}"
+    return f"{ns:.0f}ns"
+
+
+def percentile(samples: list[int] | list[float], pct: float) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
+
+
+def reject_outliers(samples: list[int]) -> list[int]:
+    if len(samples) < 4:
+        return samples
+
+    q1, _, q3 = quantiles(samples, n=4)
+    fence = (q3 - q1) * 1.5
+    return [s for s in samples if q1 - fence <= s <= q3 + fence]
+
+
+def converged(samples: list[int], precision: float, confidence: float) -> bool:
+    """True once the confidence interval of the mean is within ``precision`` of it."""
+    if len(samples) < 2:
+        return False
+
+    mean = sum(samples) / len(samples)
+    if not mean:
+        return True
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return z * stdev(samples) / len(samples) ** 0.5 <= mean * precision
+
+
+def measure(  # noqa: PLR0913
+    func: Callable[..., Any],
+    *args: Any,
+    warmup: int = 1,
+    min_rounds: int = 5,
+    max_rounds: int = 100,
+    budget: float = 1.0,
+    precision: float = 0.02,
+    confidence: float = 0.95,
+    setup: Callable[[], Any] = lambda: None,
+    on_round: Callable[[], Any] = lambda: None,
+) -> Timing:
+    """Time ``func(*args)`` until the result is stable or the time budget runs out.
+
+    After ``warmup`` untimed calls it runs at least ``min_rounds`` and at most ``max_rounds``
+    timed calls, stopping early once the ``confidence`` interval is within ``precision`` of the
+    mean or ``budget`` seconds have passed. The garbage collector is disabled while the code is
+    being timed, ``setup`` is called untimed before every round and outliers are rejected using
+    the IQR rule. Any exception is captured in the returned ``Timing`` rather than timed.
+    """
+    samples: list[int] = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        # Collect before warming up, the first call after a collection runs on cold caches and
+        # would otherwise be the first timed sample
+        gc.collect()
+        for _ in range(warmup):
+            setup()
+            func(*args)
+
+        deadline = perf_counter_ns() + int(budget * 1e9)
+        while len(samples) < max_rounds:
+            setup()
+            gc.disable()
+            start = perf_counter_ns()
+            func(*args)
+            samples.append(perf_counter_ns() - start)
+            if gc_was_enabled:
+                gc.enable()
+            on_round()
+
+            if len(samples) >= min_rounds and (
+                perf_counter_ns() >= deadline or converged(samples, precision, confidence)
+            ):
+                break
+    except Exception as e:
+        return Timing(error=f"{type(e).__name__}: {e}")
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    kept = reject_outliers(samples)
+    return Timing(kept, len(samples) - len(kept))
+
+
+# --- tests
+
+
+def test_measure() -> None:
+    timing = measure(sum, range(100), min_rounds=5, max_rounds=10)
+    assert timing.ok
+    assert 5 <= timing.rounds <= 10
+    assert timing.minimum <= timing.median <= timing.p95
+
+
+def test_measure_first_sample_not_slower(monkeypatch: Any) -> None:
+    monkeypatch.setattr(sys.modules[__name__], "reject_outliers", list)
+    values = list(range(2_000, 0, -1))
+
+    slow_starts = 0
+    for _ in range(20):
+        first, *rest = measure(sorted, values, min_rounds=10, max_rounds=10).samples
+        slow_starts += first > 1.25 * median(rest)
+
+    assert slow_starts < 10
+
+
+def test_measure_error() -> None:
+    def broken() -> None:
+        raise ValueError("nope")
+
+    timing = measure(broken)
+    assert not timing.ok
+    assert timing.error == "ValueError: nope"
+    assert str(timing) == "ERROR"
+
+
+def test_reject_outliers() -> None:
+    assert reject_outliers([10, 11, 10, 12, 11, 10, 500]) == [10, 11, 10, 12, 11, 10]
+
+
+def test_format_ns() -> None:
+    assert format_ns(1_500_000_000) == "1.50s"
+    assert format_ns(2_500) == "2.50µs"
+    assert format_ns(12) == "12ns"
@@ -1,4 +1,7 @@
-GridType = dict[tuple[int, int], str | int]
+# First Party
+from utils.grid import GridView
+
+GridType = dict[tuple[int, int], str | int] | GridView
 
 
 def draw_grid(grid: GridType, missing: str = "."):